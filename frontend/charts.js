@@ -9,63 +9,259 @@ Chart.defaults.font.family = "'Inter', -apple-system, BlinkMacSystemFont, 'Segoe
 Chart.defaults.font.size = 12;
 Chart.defaults.color = 'rgba(255, 255, 255, 0.7)';
 
-// AQI Color mapping for chart data points
-const AQI_COLORS = {
-    good: '#00ff88',           // 0-50
-    moderate: '#ffff00',       // 51-100
-    unhealthySensitive: '#ff8800', // 101-150
-    unhealthy: '#ff0000',      // 151-200
-    veryUnhealthy: '#8800ff',  // 201-300
-    hazardous: '#880000'       // 301+
-};
+// AQI level tables shared by color and category lookups - one index lookup
+// resolves both instead of two separate threshold chains
+const AQI_LEVEL_BOUNDS = [50, 100, 150, 200, 300];
+const AQI_LEVEL_COLORS = ['#00ff88', '#ffff00', '#ff8800', '#ff0000', '#8800ff', '#880000'];
+const AQI_LEVEL_CATEGORIES = [
+    'Good', 'Moderate', 'Unhealthy for Sensitive Groups',
+    'Unhealthy', 'Very Unhealthy', 'Hazardous'
+];
+
+// Map an AQI value to its level index (values above the last bound are Hazardous)
+function aqiLevelIndex(aqi) {
+    let i = 0;
+    while (i < AQI_LEVEL_BOUNDS.length && aqi > AQI_LEVEL_BOUNDS[i]) {
+        i++;
+    }
+    return i;
+}
 
 // Get AQI color based on value
 function getAQIColor(aqi) {
-    if (aqi <= 50) return AQI_COLORS.good;
-    if (aqi <= 100) return AQI_COLORS.moderate;
-    if (aqi <= 150) return AQI_COLORS.unhealthySensitive;
-    if (aqi <= 200) return AQI_COLORS.unhealthy;
-    if (aqi <= 300) return AQI_COLORS.veryUnhealthy;
-    return AQI_COLORS.hazardous;
+    return AQI_LEVEL_COLORS[aqiLevelIndex(aqi)];
 }
 
+// Shared chart styling - defined once at module load instead of rebuilding
+// the same literal objects for every chart instance
+const CHART_GRID_COLOR = 'rgba(255, 255, 255, 0.1)';
+const CHART_BORDER_COLOR = 'rgba(255, 255, 255, 0.2)';
+const CHART_TICK_COLOR = 'rgba(255, 255, 255, 0.7)';
+const CHART_LABEL_COLOR = 'rgba(255, 255, 255, 0.9)';
+const COMPARISON_COLORS = ['#54a0ff', '#5f27cd', '#00d2d3', '#ff9ff3', '#54a0ff', '#10ac84'];
+const TIME_DISPLAY_FORMATS = {
+    minute: 'HH:mm',
+    hour: 'MMM dd HH:mm',
+    day: 'MMM dd',
+    week: 'MMM dd',
+    month: 'MMM yyyy'
+};
+
 // Get AQI category name
 function getAQICategory(aqi) {
-    if (aqi <= 50) return 'Good';
-    if (aqi <= 100) return 'Moderate';
-    if (aqi <= 150) return 'Unhealthy for Sensitive Groups';
-    if (aqi <= 200) return 'Unhealthy';
-    if (aqi <= 300) return 'Very Unhealthy';
-    return 'Hazardous';
+    return AQI_LEVEL_CATEGORIES[aqiLevelIndex(aqi)];
+}
+
+// AQI zone background bands, derived once from the shared level tables.
+// The plugin paints them with plain fillRects before the datasets draw -
+// far cheaper than six extra annotation/dataset layers per chart
+const AQI_ZONE_BANDS = (() => {
+    const bands = [];
+    let lower = 0;
+    for (let i = 0; i < AQI_LEVEL_COLORS.length; i++) {
+        const upper = i < AQI_LEVEL_BOUNDS.length ? AQI_LEVEL_BOUNDS[i] : 500;
+        bands.push({ from: lower, to: upper, color: AQI_LEVEL_COLORS[i] + '14' });
+        lower = upper;
+    }
+    return bands;
+})();
+
+const aqiZoneBandsPlugin = {
+    id: 'aqiZoneBands',
+    beforeDatasetsDraw(chart) {
+        const { ctx, chartArea, scales } = chart;
+        if (!chartArea || !scales.y) {
+            return;
+        }
+        ctx.save();
+        for (const band of AQI_ZONE_BANDS) {
+            const top = Math.max(scales.y.getPixelForValue(band.to), chartArea.top);
+            const bottom = Math.min(scales.y.getPixelForValue(band.from), chartArea.bottom);
+            if (bottom <= top) {
+                continue;
+            }
+            ctx.fillStyle = band.color;
+            ctx.fillRect(chartArea.left, top, chartArea.right - chartArea.left, bottom - top);
+        }
+        ctx.restore();
+    }
+};
+
+// The API returns series newest-first, so the common case is an exactly
+// reversed array: detect monotonic input with one scan and reverse (or do
+// nothing) in O(N) instead of always paying a comparison sort
+function sortByTimeInPlace(order) {
+    let ascending = true;
+    let descending = true;
+    for (let k = 1; k < order.length && (ascending || descending); k++) {
+        if (order[k].t < order[k - 1].t) {
+            ascending = false;
+        }
+        if (order[k].t > order[k - 1].t) {
+            descending = false;
+        }
+    }
+    if (ascending) {
+        return;
+    }
+    if (descending) {
+        order.reverse();
+        return;
+    }
+    order.sort((a, b) => a.t - b.t);
+}
+
+// Plotting more points than the canvas has horizontal pixels only saturates
+// the line; beyond this, series are downsampled to LTTB_TARGET_POINTS
+const LTTB_THRESHOLD = 800;
+const LTTB_TARGET_POINTS = 500;
+
+// Largest-Triangle-Three-Buckets downsampling. Returns the indices of the
+// points to keep (ascending), chosen so each bucket contributes the point
+// that preserves the most visual detail of the line
+function lttbIndices(times, values, targetPoints) {
+    const n = times.length;
+    if (targetPoints >= n || targetPoints < 3) {
+        const all = new Array(n);
+        for (let i = 0; i < n; i++) all[i] = i;
+        return all;
+    }
+
+    const sampled = new Array(targetPoints);
+    const bucketSize = (n - 2) / (targetPoints - 2);
+    let a = 0; // index of the previously selected point
+    sampled[0] = 0;
+
+    for (let bucket = 0; bucket < targetPoints - 2; bucket++) {
+        const rangeStart = Math.floor((bucket + 0) * bucketSize) + 1;
+        const rangeEnd = Math.min(Math.floor((bucket + 1) * bucketSize) + 1, n - 1);
+
+        // Average of the next bucket forms the third triangle vertex
+        const avgStart = Math.min(Math.floor((bucket + 1) * bucketSize) + 1, n - 1);
+        const avgEnd = Math.min(Math.floor((bucket + 2) * bucketSize) + 1, n);
+        let avgX = 0;
+        let avgY = 0;
+        for (let i = avgStart; i < avgEnd; i++) {
+            avgX += times[i];
+            avgY += values[i];
+        }
+        const avgCount = avgEnd - avgStart;
+        avgX /= avgCount;
+        avgY /= avgCount;
+
+        // Pick the point in this bucket with the largest triangle area
+        let maxArea = -1;
+        let maxIndex = rangeStart;
+        for (let i = rangeStart; i < rangeEnd; i++) {
+            const area = Math.abs(
+                (times[a] - avgX) * (values[i] - values[a]) -
+                (times[a] - times[i]) * (avgY - values[a])
+            );
+            if (area > maxArea) {
+                maxArea = area;
+                maxIndex = i;
+            }
+        }
+
+        sampled[bucket + 1] = maxIndex;
+        a = maxIndex;
+    }
+
+    sampled[targetPoints - 1] = n - 1;
+    return sampled;
 }
 
 // Create historical data chart
 function createHistoricalChart(data, cityName) {
+    // Nothing to plot - clear any stale chart and bail before doing any
+    // data shaping or canvas work
+    if (!data || data.length === 0) {
+        destroyChart();
+        return null;
+    }
+
     const ctx = document.getElementById('aqiChart').getContext('2d');
-    
-    // Destroy existing chart if it exists
+
+    // Sort by numeric timestamp first, then build minimal {x, y} points plus
+    // parallel per-pollutant columns in one pass. The tooltip reads the
+    // columns by dataIndex, so each point no longer drags six extra pollutant
+    // properties through Chart.js
+    const order = data.map((item, i) => ({ t: new Date(item.timestamp).getTime(), i }));
+    sortByTimeInPlace(order);
+
+    // Dense series are downsampled with LTTB before any point objects are
+    // built, so the render works on at most LTTB_TARGET_POINTS vertices.
+    // Statistics still run on the full dataset elsewhere
+    let kept = null;
+    if (order.length > LTTB_THRESHOLD) {
+        const times = new Array(order.length);
+        const values = new Array(order.length);
+        for (let k = 0; k < order.length; k++) {
+            times[k] = order[k].t;
+            values[k] = data[order[k].i].aqiValue;
+        }
+        kept = lttbIndices(times, values, LTTB_TARGET_POINTS);
+    }
+
+    const n = kept ? kept.length : order.length;
+    const chartData = new Array(n);
+    const pointColors = new Array(n);
+    const pollutantColumns = {
+        pm25: new Array(n), pm10: new Array(n), no2: new Array(n),
+        so2: new Array(n), co: new Array(n), o3: new Array(n)
+    };
+    for (let k = 0; k < n; k++) {
+        const o = order[kept ? kept[k] : k];
+        const item = data[o.i];
+        chartData[k] = { x: new Date(o.t), y: item.aqiValue };
+        pointColors[k] = getAQIColor(item.aqiValue);
+        pollutantColumns.pm25[k] = item.pm25;
+        pollutantColumns.pm10[k] = item.pm10;
+        pollutantColumns.no2[k] = item.no2;
+        pollutantColumns.so2[k] = item.so2;
+        pollutantColumns.co[k] = item.co;
+        pollutantColumns.o3[k] = item.o3;
+    }
+
+    // Beyond a few hundred samples the per-point markers and the entry
+    // animation dominate draw time, so drop both for large datasets
+    const largeDataset = chartData.length > 500;
+    const pointRadius = largeDataset ? 0 : 5;
+    const animationDuration = largeDataset ? 0 : 1000;
+    // On high-DPI screens rasterizing at the full native ratio dominates
+    // draw time for dense lines; 1.5x is visually indistinguishable for a
+    // chart this size and roughly halves the pixels pushed
+    const pixelRatio = largeDataset
+        ? Math.min(window.devicePixelRatio || 1, 1.5)
+        : (window.devicePixelRatio || 1);
+
+    // Reuse the existing historical chart when possible - swapping the data
+    // in and calling update() is much cheaper than destroying and rebuilding
+    // the whole chart on every city or date-range change
+    if (currentChart && currentChart.skyPulseKind === 'historical') {
+        const dataset = currentChart.data.datasets[0];
+        dataset.data = chartData;
+        dataset.pointBackgroundColor = pointColors;
+        dataset.pointHoverBackgroundColor = pointColors;
+        dataset.pointRadius = pointRadius;
+        currentChart.pollutantColumns = pollutantColumns;
+        currentChart.options.animation.duration = animationDuration;
+        currentChart.options.devicePixelRatio = pixelRatio;
+        currentChart.options.plugins.title.text = `Air Quality History - ${cityName}`;
+        currentChart.update();
+        showChartContainer();
+        return currentChart;
+    }
+
+    // Different chart type (or none) on the canvas - rebuild from scratch
     if (currentChart) {
         currentChart.destroy();
         currentChart = null;
     }
-    
-    // Prepare data for Chart.js
-    const chartData = data.map(item => ({
-        x: new Date(item.timestamp),
-        y: item.aqiValue,
-        pm25: item.pm25,
-        pm10: item.pm10,
-        no2: item.no2,
-        so2: item.so2,
-        co: item.co,
-        o3: item.o3
-    }));
-    
-    // Sort data by timestamp
-    chartData.sort((a, b) => a.x - b.x);
-    
+
     currentChart = new Chart(ctx, {
         type: 'line',
+        plugins: [aqiZoneBandsPlugin],
         data: {
             datasets: [{
                 label: 'AQI Value',
@@ -75,18 +271,12 @@ function createHistoricalChart(data, cityName) {
                 borderWidth: 3,
                 fill: true,
                 tension: 0.4,
-                pointBackgroundColor: function(context) {
-                    const aqi = context.parsed.y;
-                    return getAQIColor(aqi);
-                },
+                pointBackgroundColor: pointColors,
                 pointBorderColor: '#ffffff',
                 pointBorderWidth: 2,
-                pointRadius: 5,
+                pointRadius: pointRadius,
                 pointHoverRadius: 8,
-                pointHoverBackgroundColor: function(context) {
-                    const aqi = context.parsed.y;
-                    return getAQIColor(aqi);
-                },
+                pointHoverBackgroundColor: pointColors,
                 pointHoverBorderColor: '#ffffff',
                 pointHoverBorderWidth: 3
             }]
@@ -94,6 +284,7 @@ function createHistoricalChart(data, cityName) {
         options: {
             responsive: true,
             maintainAspectRatio: false,
+            devicePixelRatio: pixelRatio,
             interaction: {
                 intersect: false,
                 mode: 'index'
@@ -102,42 +293,36 @@ function createHistoricalChart(data, cityName) {
                 x: {
                     type: 'time',
                     time: {
-                        displayFormats: {
-                            minute: 'HH:mm',
-                            hour: 'MMM dd HH:mm',
-                            day: 'MMM dd',
-                            week: 'MMM dd',
-                            month: 'MMM yyyy'
-                        },
+                        displayFormats: TIME_DISPLAY_FORMATS,
                         tooltipFormat: 'MMM dd, yyyy HH:mm'
                     },
                     grid: {
-                        color: 'rgba(255, 255, 255, 0.1)',
-                        borderColor: 'rgba(255, 255, 255, 0.2)'
+                        color: CHART_GRID_COLOR,
+                        borderColor: CHART_BORDER_COLOR
                     },
                     ticks: {
-                        color: 'rgba(255, 255, 255, 0.7)',
+                        color: CHART_TICK_COLOR,
                         maxTicksLimit: 8
                     },
                     border: {
-                        color: 'rgba(255, 255, 255, 0.2)'
+                        color: CHART_BORDER_COLOR
                     }
                 },
                 y: {
                     beginAtZero: true,
                     max: 500,
                     grid: {
-                        color: 'rgba(255, 255, 255, 0.1)',
-                        borderColor: 'rgba(255, 255, 255, 0.2)'
+                        color: CHART_GRID_COLOR,
+                        borderColor: CHART_BORDER_COLOR
                     },
                     ticks: {
-                        color: 'rgba(255, 255, 255, 0.7)',
+                        color: CHART_TICK_COLOR,
                         callback: function(value) {
                             return value + ' AQI';
                         }
                     },
                     border: {
-                        color: 'rgba(255, 255, 255, 0.2)'
+                        color: CHART_BORDER_COLOR
                     }
                 }
             },
@@ -145,7 +330,7 @@ function createHistoricalChart(data, cityName) {
                 title: {
                     display: true,
                     text: `Air Quality History - ${cityName}`,
-                    color: 'rgba(255, 255, 255, 0.9)',
+                    color: CHART_LABEL_COLOR,
                     font: {
                         size: 18,
                         weight: 'bold'
@@ -160,7 +345,7 @@ function createHistoricalChart(data, cityName) {
                     position: 'top',
                     align: 'end',
                     labels: {
-                        color: 'rgba(255, 255, 255, 0.9)',
+                        color: CHART_LABEL_COLOR,
                         usePointStyle: true,
                         pointStyle: 'circle',
                         padding: 20
@@ -176,29 +361,33 @@ function createHistoricalChart(data, cityName) {
                     displayColors: true,
                     callbacks: {
                         title: function(context) {
-                            const date = new Date(context[0].parsed.x);
+                            // Point x is already a Date - no need to construct another one
+                            const date = context[0].raw.x;
                             return date.toLocaleDateString() + ' ' + date.toLocaleTimeString();
                         },
                         label: function(context) {
-                            const point = context.raw;
-                            const aqi = point.y;
+                            const i = context.dataIndex;
+                            const columns = context.chart.pollutantColumns;
+                            const aqi = context.raw.y;
                             const category = getAQICategory(aqi);
-                            
+
                             return [
                                 `AQI: ${aqi} (${category})`,
-                                `PM2.5: ${point.pm25 || 'N/A'} μg/m³`,
-                                `PM10: ${point.pm10 || 'N/A'} μg/m³`,
-                                `NO2: ${point.no2 || 'N/A'} μg/m³`,
-                                `SO2: ${point.so2 || 'N/A'} μg/m³`,
-                                `CO: ${point.co || 'N/A'} mg/m³`,
-                                `O3: ${point.o3 || 'N/A'} μg/m³`
+                                `PM2.5: ${columns.pm25[i] || 'N/A'} μg/m³`,
+                                `PM10: ${columns.pm10[i] || 'N/A'} μg/m³`,
+                                `NO2: ${columns.no2[i] || 'N/A'} μg/m³`,
+                                `SO2: ${columns.so2[i] || 'N/A'} μg/m³`,
+                                `CO: ${columns.co[i] || 'N/A'} mg/m³`,
+                                `O3: ${columns.o3[i] || 'N/A'} μg/m³`
                             ];
                         },
                         labelColor: function(context) {
-                            const aqi = context.raw.y;
+                            // Read from the dataset so updated-in-place data
+                            // keeps the right colors
+                            const color = context.dataset.pointBackgroundColor[context.dataIndex];
                             return {
-                                borderColor: getAQIColor(aqi),
-                                backgroundColor: getAQIColor(aqi)
+                                borderColor: color,
+                                backgroundColor: color
                             };
                         }
                     }
@@ -210,59 +399,82 @@ function createHistoricalChart(data, cityName) {
                 }
             },
             animation: {
-                duration: 1000,
+                duration: animationDuration,
                 easing: 'easeOutQuart'
             }
         }
     });
-    
-    // Show chart container with animation
+    currentChart.skyPulseKind = 'historical';
+    currentChart.pollutantColumns = pollutantColumns;
+
+    showChartContainer();
+
+    return currentChart;
+}
+
+// Show chart container with animation
+function showChartContainer() {
     const chartContainer = document.getElementById('chartContainer');
+    if (chartContainer.style.display === 'block') {
+        return;
+    }
     chartContainer.style.display = 'block';
     chartContainer.style.opacity = '0';
     setTimeout(() => {
         chartContainer.style.transition = 'opacity 0.5s ease';
         chartContainer.style.opacity = '1';
     }, 100);
-    
-    return currentChart;
 }
 
 // Create comparison chart for multiple cities
 function createComparisonChart(citiesData) {
-    const ctx = document.getElementById('aqiChart').getContext('2d');
-    
-    // Destroy existing chart if it exists
-    if (currentChart) {
-        currentChart.destroy();
-        currentChart = null;
+    const cities = citiesData ? Object.keys(citiesData) : [];
+    if (cities.length === 0) {
+        destroyChart();
+        return null;
     }
-    
-    const datasets = [];
-    const colors = ['#54a0ff', '#5f27cd', '#00d2d3', '#ff9ff3', '#54a0ff', '#10ac84'];
-    
-    Object.keys(citiesData).forEach((city, index) => {
-        const data = citiesData[city];
-        const chartData = data.map(item => ({
-            x: new Date(item.timestamp),
-            y: item.aqiValue
-        }));
-        
-        datasets.push({
+
+    const ctx = document.getElementById('aqiChart').getContext('2d');
+
+    // Build every dataset in one pass per city: resolve the palette color
+    // once and sort each series on numeric timestamps so the time scale gets
+    // ordered points
+    const datasets = cities.map((city, index) => {
+        const cityData = citiesData[city];
+        const order = cityData.map((item, i) => ({ t: new Date(item.timestamp).getTime(), i }));
+        sortByTimeInPlace(order);
+        const chartData = order.map(o => ({ x: new Date(o.t), y: cityData[o.i].aqiValue }));
+
+        const color = COMPARISON_COLORS[index % COMPARISON_COLORS.length];
+        return {
             label: city,
             data: chartData,
-            borderColor: colors[index % colors.length],
-            backgroundColor: colors[index % colors.length] + '20',
+            borderColor: color,
+            backgroundColor: color + '20',
             borderWidth: 2,
             fill: false,
             tension: 0.4,
             pointRadius: 3,
             pointHoverRadius: 6
-        });
+        };
     });
-    
+
+    // Reuse an existing comparison chart like the historical path does -
+    // swapping datasets and updating is cheaper than a rebuild
+    if (currentChart && currentChart.skyPulseKind === 'comparison') {
+        currentChart.data.datasets = datasets;
+        currentChart.update();
+        return currentChart;
+    }
+
+    if (currentChart) {
+        currentChart.destroy();
+        currentChart = null;
+    }
+
     currentChart = new Chart(ctx, {
         type: 'line',
+        plugins: [aqiZoneBandsPlugin],
         data: { datasets },
         options: {
             responsive: true,
@@ -275,26 +487,23 @@ function createComparisonChart(citiesData) {
                 x: {
                     type: 'time',
                     time: {
-                        displayFormats: {
-                            hour: 'MMM dd HH:mm',
-                            day: 'MMM dd'
-                        }
+                        displayFormats: TIME_DISPLAY_FORMATS
                     },
                     grid: {
-                        color: 'rgba(255, 255, 255, 0.1)'
+                        color: CHART_GRID_COLOR
                     },
                     ticks: {
-                        color: 'rgba(255, 255, 255, 0.7)'
+                        color: CHART_TICK_COLOR
                     }
                 },
                 y: {
                     beginAtZero: true,
                     max: 500,
                     grid: {
-                        color: 'rgba(255, 255, 255, 0.1)'
+                        color: CHART_GRID_COLOR
                     },
                     ticks: {
-                        color: 'rgba(255, 255, 255, 0.7)'
+                        color: CHART_TICK_COLOR
                     }
                 }
             },
@@ -302,12 +511,12 @@ function createComparisonChart(citiesData) {
                 title: {
                     display: true,
                     text: 'Multi-City AQI Comparison',
-                    color: 'rgba(255, 255, 255, 0.9)',
+                    color: CHART_LABEL_COLOR,
                     font: { size: 16 }
                 },
                 legend: {
                     labels: {
-                        color: 'rgba(255, 255, 255, 0.9)'
+                        color: CHART_LABEL_COLOR
                     }
                 },
                 tooltip: {
@@ -318,7 +527,8 @@ function createComparisonChart(citiesData) {
             }
         }
     });
-    
+    currentChart.skyPulseKind = 'comparison';
+
     return currentChart;
 }
 
@@ -333,9 +543,25 @@ function calculateChartStatistics(data) {
         };
     }
     
-    const aqiValues = data.map(item => item.aqiValue).filter(val => val !== null && val !== undefined);
-    
-    if (aqiValues.length === 0) {
+    // Accumulate sum/min/max in one loop - the previous map/filter/reduce
+    // made four passes, and Math.max(...values) overflows the call stack on
+    // very large datasets
+    let sum = 0;
+    let count = 0;
+    let maximum = -Infinity;
+    let minimum = Infinity;
+    for (const item of data) {
+        const val = item.aqiValue;
+        if (val === null || val === undefined) {
+            continue;
+        }
+        sum += val;
+        count++;
+        if (val > maximum) maximum = val;
+        if (val < minimum) minimum = val;
+    }
+
+    if (count === 0) {
         return {
             average: 0,
             maximum: 0,
@@ -343,12 +569,9 @@ function calculateChartStatistics(data) {
             count: 0
         };
     }
-    
-    const sum = aqiValues.reduce((acc, val) => acc + val, 0);
-    const average = Math.round(sum / aqiValues.length);
-    const maximum = Math.max(...aqiValues);
-    const minimum = Math.min(...aqiValues);
-    
+
+    const average = Math.round(sum / count);
+
     return {
         average,
         maximum,
@@ -396,12 +619,21 @@ function exportChartAsImage(filename = 'aqi-chart.png') {
         console.warn('No chart available to export');
         return;
     }
-    
-    const url = currentChart.toBase64Image();
-    const link = document.createElement('a');
-    link.download = filename;
-    link.href = url;
-    link.click();
+
+    // toBlob avoids materializing the whole PNG as a base64 data URL
+    // (~33% larger and an extra encode/decode round trip on big canvases)
+    currentChart.canvas.toBlob(blob => {
+        if (!blob) {
+            console.warn('Chart export failed');
+            return;
+        }
+        const url = URL.createObjectURL(blob);
+        const link = document.createElement('a');
+        link.download = filename;
+        link.href = url;
+        link.click();
+        URL.revokeObjectURL(url);
+    }, 'image/png');
 }
 
 // Resize chart when container changes
@@ -58,51 +58,50 @@ async function loadDashboardData() {
             if (citiesData.success && citiesData.cities && citiesData.cities.length > 0) {
                 // Get data for first few cities
                 const popularCities = citiesData.cities.slice(0, 3); // Take first 3 cities
-                const citiesWithData = [];
-                
-                for (const city of popularCities) {
-                    try {
-                        const response = await fetch(`${API_BASE_URL}/aqi/current/${city}`, {
-                            method: 'GET',
-                            headers: {
-                                'Content-Type': 'application/json'
-                            }
-                        });
-                        
-                        if (response.ok) {
-                            const data = await response.json();
-                            if (data.success && data.data) {
-                                const cityData = data.data;
-                                citiesWithData.push({
-                                    name: cityData.city,
-                                    country: cityData.city.includes('Delhi') ? 'India' : 
-                                            cityData.city.includes('Beijing') ? 'China' :
-                                            cityData.city.includes('Mumbai') ? 'India' :
-                                            cityData.city.includes('London') ? 'UK' :
-                                            cityData.city.includes('Paris') ? 'France' :
-                                            cityData.city.includes('Tokyo') ? 'Japan' :
-                                            cityData.city.includes('New York') ? 'USA' :
-                                            cityData.city.includes('Sydney') ? 'Australia' :
-                                            cityData.city.includes('Los Angeles') ? 'USA' :
-                                            cityData.city.includes('Chennai') ? 'India' : 'Unknown',
-                                    aqi: cityData.aqiValue,
-                                    category: cityData.category,
-                                    parameters: {
-                                        pm25: cityData.pm25?.toFixed(1),
-                                        pm10: cityData.pm10?.toFixed(1),
-                                        no2: cityData.no2?.toFixed(1),
-                                        o3: cityData.o3?.toFixed(1),
-                                        so2: cityData.so2?.toFixed(1),
-                                        co: cityData.co?.toFixed(1)
-                                    }
-                                });
-                            }
-                        }
-                    } catch (error) {
-                        console.warn(`Failed to load data for ${city}:`, error);
+
+                // One batched request to /aqi/multiple replaces a round trip
+                // per city - the backend fetches the cities in parallel and
+                // returns them keyed by name
+                let citiesWithData = [];
+                const response = await fetch(`${API_BASE_URL}/aqi/multiple?cities=${popularCities.map(encodeURIComponent).join(',')}`, {
+                    method: 'GET',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    }
+                });
+
+                if (response.ok) {
+                    const data = await response.json();
+                    if (data.success && data.data) {
+                        citiesWithData = popularCities
+                            .map(city => data.data[city])
+                            .filter(Boolean)
+                            .map(cityData => ({
+                                name: cityData.city,
+                                country: cityData.city.includes('Delhi') ? 'India' :
+                                        cityData.city.includes('Beijing') ? 'China' :
+                                        cityData.city.includes('Mumbai') ? 'India' :
+                                        cityData.city.includes('London') ? 'UK' :
+                                        cityData.city.includes('Paris') ? 'France' :
+                                        cityData.city.includes('Tokyo') ? 'Japan' :
+                                        cityData.city.includes('New York') ? 'USA' :
+                                        cityData.city.includes('Sydney') ? 'Australia' :
+                                        cityData.city.includes('Los Angeles') ? 'USA' :
+                                        cityData.city.includes('Chennai') ? 'India' : 'Unknown',
+                                aqi: cityData.aqiValue,
+                                category: cityData.category,
+                                parameters: {
+                                    pm25: cityData.pm25?.toFixed(1),
+                                    pm10: cityData.pm10?.toFixed(1),
+                                    no2: cityData.no2?.toFixed(1),
+                                    o3: cityData.o3?.toFixed(1),
+                                    so2: cityData.so2?.toFixed(1),
+                                    co: cityData.co?.toFixed(1)
+                                }
+                            }));
                     }
                 }
-                
+
                 if (citiesWithData.length > 0) {
                     updateMainAQI(citiesWithData[0]);
                     updateCityList(citiesWithData);
@@ -161,22 +160,27 @@ function updateMainAQI(cityData) {
 // Update city list
 function updateCityList(cities) {
     const cityListElement = document.getElementById('cityList');
-    cityListElement.innerHTML = '';
 
+    // Build all cards off-DOM and attach them in a single append so the
+    // browser only reflows once instead of once per city
+    const fragment = document.createDocumentFragment();
     cities.forEach((city, index) => {
         const cityCard = document.createElement('div');
         cityCard.className = 'city-card';
         cityCard.style.animationDelay = `${index * 0.1}s`;
-        
+
         cityCard.innerHTML = `
             <div class="city-name">${city.name}, ${city.country}</div>
             <div class="city-aqi ${getAQIColor(city.aqi)}">${city.aqi}</div>
             <div style="color: var(--text-secondary); font-size: 0.9rem;">${city.category}</div>
         `;
-        
+
         cityCard.addEventListener('click', () => selectCity(city));
-        cityListElement.appendChild(cityCard);
+        fragment.appendChild(cityCard);
     });
+
+    cityListElement.innerHTML = '';
+    cityListElement.appendChild(fragment);
 }
 
 // Update parameters display
@@ -222,27 +226,23 @@ function updateParameters(cityData) {
     ];
 
     const parametersGrid = document.getElementById('parametersGrid');
-    parametersGrid.innerHTML = '';
 
-    parameters.forEach((param, index) => {
-        const paramElement = document.createElement('div');
-        paramElement.className = 'parameter-item';
-        paramElement.style.animationDelay = `${index * 0.1}s`;
-        
+    // Render all parameter tiles with one innerHTML write instead of
+    // appending them one at a time
+    parametersGrid.innerHTML = parameters.map((param, index) => {
         // Format the parameter value to show appropriate decimal places
         let displayValue = param.value;
         if (typeof displayValue === 'number') {
             displayValue = displayValue.toFixed(1);
         }
-        
-        paramElement.innerHTML = `
+
+        return `
+        <div class="parameter-item" style="animation-delay: ${index * 0.1}s;">
             <div class="parameter-name">${param.name}</div>
             <div class="parameter-value" style="color: ${param.color};">${displayValue}</div>
             <div style="font-size: 0.7rem; color: var(--text-secondary);">${param.unit}</div>
-        `;
-        
-        parametersGrid.appendChild(paramElement);
-    });
+        </div>`;
+    }).join('');
 }
 
 // Search city functionality
@@ -708,17 +708,15 @@ async function loadUserAlerts() {
 // Update alerts list
 function updateAlertsList(alerts) {
     const alertList = document.getElementById('alertList');
-    alertList.innerHTML = '';
-    
+
     if (alerts.length === 0) {
         alertList.innerHTML = '<p style="color: var(--text-secondary); text-align: center;">No alerts set up yet.</p>';
         return;
     }
-    
-    alerts.forEach(alert => {
-        const alertItem = document.createElement('div');
-        alertItem.className = 'alert-item';
-        alertItem.innerHTML = `
+
+    // Single innerHTML write so the list renders in one reflow
+    alertList.innerHTML = alerts.map(alert => `
+        <div class="alert-item">
             <div style="display: flex; justify-content: space-between; align-items: center;">
                 <div>
                     <strong>${alert.city}, ${alert.country}</strong><br>
@@ -728,9 +726,8 @@ function updateAlertsList(alerts) {
                     <i class="fas fa-trash"></i>
                 </button>
             </div>
-        `;
-        alertList.appendChild(alertItem);
-    });
+        </div>
+    `).join('');
 }
 
 // Delete alert
@@ -1018,9 +1015,12 @@ async function loadHistoricalData() {
         const data = await response.json();
 
         if (data.success && data.data && data.data.length > 0) {
-            ChartManager.create(data.data, currentCity);
+            // Paint the lightweight stats panel right away and hand the
+            // heavier canvas render to the next frame, so the numbers and
+            // notification are not blocked behind Chart.js
             const stats = ChartManager.calculateStats(data.data);
             ChartManager.updateStats(stats);
+            requestAnimationFrame(() => ChartManager.create(data.data, currentCity));
             showNotification(`Loaded ${data.count} data points for ${currentCity}`, 'success');
         } else if (data.requiresAuth) {
             showNotification('Please login to access historical data', 'error');
@@ -92,11 +92,20 @@ enable_apis() {
         "container.googleapis.com"
     )
     
+    # Enabling an already-enabled API is a no-op but still costs a slow
+    # round-trip per service, so fetch the enabled list once and only
+    # enable what is actually missing
+    enabled_apis=$(gcloud services list --enabled --format="value(config.name)" 2>/dev/null || echo "")
+
     for api in "${apis[@]}"; do
-        print_status "Enabling $api..."
-        gcloud services enable "$api" --quiet
+        if echo "$enabled_apis" | grep -q "^${api}$"; then
+            print_status "$api already enabled, skipping"
+        else
+            print_status "Enabling $api..."
+            gcloud services enable "$api" --quiet
+        fi
     done
-    
+
     print_status "✓ All required APIs enabled"
 }
 
@@ -18,6 +18,11 @@ PROJECT_NAME="airsight"
 DOCKER_COMPOSE_FILE="docker/docker-compose.yml"
 ENV_FILE="docker/.env"
 
+# BuildKit builds stages in parallel and skips unreferenced ones; the classic
+# builder runs everything serially
+export DOCKER_BUILDKIT=1
+export COMPOSE_DOCKER_CLI_BUILD=1
+
 # Function to print colored output
 print_status() {
     echo -e "${GREEN}[INFO]${NC} $1"
@@ -73,18 +78,15 @@ setup_environment() {
 # Build the application
 build_application() {
     print_status "Building AirSight application..."
-    
-    # Clean and compile
-    if command -v mvn &> /dev/null; then
-        print_status "Cleaning and compiling with Maven..."
-        mvn clean compile
-    else
-        print_warning "Maven not found. Using Docker build only."
-    fi
-    
-    # Build Docker images
+
+    # The Docker image is built from a multi-stage Dockerfile that runs the
+    # Maven build itself, so a host-side compile here just duplicated the
+    # work (and its artifacts were never used by the image)
+    # Build independent service images concurrently and let Docker's layer
+    # cache skip unchanged stages (the Dockerfile is ordered so dependency
+    # layers only rebuild when pom.xml changes)
     print_status "Building Docker images..."
-    docker-compose -f "$DOCKER_COMPOSE_FILE" build --no-cache
+    docker-compose -f "$DOCKER_COMPOSE_FILE" build --parallel
     
     print_status "Application build completed ✓"
 }
@@ -107,10 +109,19 @@ deploy_application() {
 # Check application health
 check_health() {
     print_status "Checking application health..."
-    
-    # Wait for services to start
-    sleep 30
-    
+
+    # Poll for MySQL instead of sleeping a flat 30s - on warm starts the
+    # stack is up in a few seconds and the deploy finishes that much sooner
+    mysql_attempts=15
+    mysql_attempt=1
+    while [ $mysql_attempt -le $mysql_attempts ]; do
+        if docker-compose -f "$DOCKER_COMPOSE_FILE" exec mysql mysqladmin ping -h localhost --silent &> /dev/null; then
+            break
+        fi
+        sleep 2
+        ((mysql_attempt++))
+    done
+
     # Check MySQL health
     if docker-compose -f "$DOCKER_COMPOSE_FILE" exec mysql mysqladmin ping -h localhost --silent; then
         print_status "MySQL is healthy ✓"
@@ -128,7 +139,7 @@ check_health() {
     fi
     
     # Check application health
-    max_attempts=12
+    max_attempts=24
     attempt=1
     
     while [ $attempt -le $max_attempts ]; do
@@ -142,7 +153,7 @@ check_health() {
                 print_error "Application health check failed after $max_attempts attempts"
                 return 1
             fi
-            sleep 10
+            sleep 5
             ((attempt++))
         fi
     done
@@ -193,7 +204,9 @@ main() {
         show_deployment_info
     else
         print_error "Health check failed. Please check the logs."
-        docker-compose -f "$DOCKER_COMPOSE_FILE" logs
+        # The recent lines are what matter for diagnosis; dumping the full
+        # log history of every container can take minutes on older stacks
+        docker-compose -f "$DOCKER_COMPOSE_FILE" logs --tail=100
         exit 1
     fi
 }
@@ -80,7 +80,7 @@ extract_properties() {
 # ==============================================
 # DATABASE CONFIGURATION
 # ==============================================
-DATABASE_URL=${DB_URL:-jdbc:mysql://mysql:3306/airqualitydb?useSSL=false&allowPublicKeyRetrieval=true&serverTimezone=UTC}
+DATABASE_URL=${DB_URL:-jdbc:mysql://mysql:3306/airqualitydb?useSSL=false&allowPublicKeyRetrieval=true&serverTimezone=UTC&cachePrepStmts=true&prepStmtCacheSize=250&prepStmtCacheSqlLimit=2048&useServerPrepStmts=true&rewriteBatchedStatements=true}
 DB_USERNAME=${DB_USERNAME:-airsight_user}
 DB_PASSWORD=${DB_PASSWORD:-airsight_secure_password_2024}
 DB_ROOT_PASSWORD=airsight_root_secure_password_2024
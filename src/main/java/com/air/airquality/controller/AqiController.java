@@ -4,6 +4,7 @@ import com.air.airquality.dto.AqiResponse;
 import com.air.airquality.model.AqiData;
 import com.air.airquality.services.AqiService;
 import com.air.airquality.services.OpenAQService;
+import com.air.airquality.util.CityNameUtil;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.format.annotation.DateTimeFormat;
 import org.springframework.http.HttpStatus;
@@ -17,6 +18,7 @@ import java.time.LocalDateTime;
 import java.util.*;
 import java.util.concurrent.ConcurrentHashMap;
 import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.TimeUnit;
 import java.util.stream.Collectors;
 
 import com.air.airquality.services.JwtService;
@@ -93,19 +95,28 @@ public class AqiController {
             response.put("query", query);
             response.put("found", matchingCities.size());
             
-            // If cities found, get current data for the first one
+            // If cities found, get current data for the first one. The
+            // lookup runs async, but we must join it before returning:
+            // the old thenAccept callback mutated the response map while
+            // (or after) it was being serialized, so "currentData" showed
+            // up or not depending on timing
             if (!matchingCities.isEmpty()) {
-                CompletableFuture.supplyAsync(() -> {
+                CompletableFuture<AqiData> currentDataFuture = CompletableFuture.supplyAsync(() -> {
                     try {
                         return openAQService.getCurrentAqiData(matchingCities.get(0));
                     } catch (Exception e) {
                         return null;
                     }
-                }).thenAccept(aqiData -> {
+                });
+                try {
+                    AqiData aqiData = currentDataFuture.get(2, TimeUnit.SECONDS);
                     if (aqiData != null) {
                         response.put("currentData", buildAqiResponse(aqiData));
                     }
-                });
+                } catch (Exception e) {
+                    // Search results are still useful without current data
+                    logger.debug("Skipping current data for search '{}': {}", query, e.getMessage());
+                }
             }
             
             return ResponseEntity.ok(response);
@@ -255,21 +266,19 @@ public class AqiController {
                 logger.warn("Large date range requested for city {}: {} days", normalizedCity, daysBetween);
             }
 
-            List<AqiResponse> historicalData = aqiService.getHistoricalData(normalizedCity, startDate, endDate);
-
-            // Implement data sampling for very large datasets to improve frontend performance
-            boolean wasSampled = false;
-            if (historicalData.size() > 10000) {
-                logger.info("Sampling large dataset for city {}: {} records", normalizedCity, historicalData.size());
-                // Sample every nth record to keep dataset manageable
-                int step = Math.max(1, historicalData.size() / 10000);
-                List<AqiResponse> sampledData = new ArrayList<>();
-                for (int i = 0; i < historicalData.size(); i += step) {
-                    sampledData.add(historicalData.get(i));
-                }
-                historicalData = sampledData;
-                wasSampled = true;
+            // Count first, then either fetch the range directly or page through
+            // it with stride sampling - very large ranges are no longer
+            // materialized in full before being thinned out
+            long totalInRange = aqiService.countHistoricalData(normalizedCity, startDate, endDate);
+            boolean wasSampled = totalInRange > 10000;
+            List<AqiResponse> historicalData;
+            if (wasSampled) {
+                logger.info("Sampling large dataset for city {}: {} records", normalizedCity, totalInRange);
+                historicalData = aqiService.getSampledHistoricalData(normalizedCity, startDate, endDate,
+                        totalInRange, 10000);
                 logger.info("Sampled to {} records for better performance", historicalData.size());
+            } else {
+                historicalData = aqiService.getHistoricalData(normalizedCity, startDate, endDate);
             }
 
             Map<String, Object> response = new HashMap<>();
@@ -333,9 +342,7 @@ public class AqiController {
 
     // Utility methods
     private String normalizeCity(String city) {
-        return Arrays.stream(city.toLowerCase().trim().split("\\s+"))
-                .map(word -> word.substring(0, 1).toUpperCase() + word.substring(1))
-                .collect(Collectors.joining(" "));
+        return CityNameUtil.normalize(city);
     }
 
     private Map<String, Object> buildSuccessResponse(AqiData aqiData) {
@@ -8,6 +8,7 @@ import org.springframework.http.HttpStatus;
 import org.springframework.http.MediaType;
 import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.*;
+import org.springframework.web.servlet.mvc.method.annotation.StreamingResponseBody;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
@@ -15,6 +16,7 @@ import javax.servlet.http.HttpServletRequest;
 import java.time.LocalDateTime;
 import java.time.format.DateTimeFormatter;
 import java.util.Map;
+import java.util.regex.Pattern;
 
 @RestController
 @RequestMapping("/api/export")
@@ -22,6 +24,10 @@ public class DataExportController {
 
     private static final Logger logger = LoggerFactory.getLogger(DataExportController.class);
 
+    // Compiled once - String.replaceAll recompiles its regex on every export
+    private static final Pattern FILENAME_SANITIZER = Pattern.compile("[^a-zA-Z0-9]");
+    private static final DateTimeFormatter FILENAME_TIMESTAMP = DateTimeFormatter.ofPattern("yyyyMMdd_HHmmss");
+
 
     @Autowired
     private PdfGenerationService pdfGenerationService;
@@ -60,26 +66,21 @@ public class DataExportController {
 
             logger.info("Generating PDF report for city: {}, user: {}", city, userId);
 
-            // Generate PDF for all available data for this city
-            byte[] pdfData = pdfGenerationService.generateAirQualityReport(city, null, null);
-
-            if (pdfData == null || pdfData.length == 0) {
-                logger.error("Empty PDF generated for city: {}", city);
-                return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR)
-                        .body(Map.of("success", false, "message", "Failed to generate PDF report"));
-            }
+            // Stream the PDF for all available data straight to the response
+            // instead of materializing the whole document as a byte[] first
+            StreamingResponseBody pdfStream = outputStream ->
+                    pdfGenerationService.generateAirQualityReport(city, null, null, outputStream);
 
             // Prepare response headers
             HttpHeaders headers = new HttpHeaders();
             headers.setContentType(MediaType.APPLICATION_PDF);
             headers.setContentDispositionFormData("attachment",
                     String.format("air_quality_report_%s_%s.pdf",
-                            city.replaceAll("[^a-zA-Z0-9]", "_"),
-                            LocalDateTime.now().format(DateTimeFormatter.ofPattern("yyyyMMdd_HHmmss"))));
-            headers.setContentLength(pdfData.length);
+                            FILENAME_SANITIZER.matcher(city).replaceAll("_"),
+                            LocalDateTime.now().format(FILENAME_TIMESTAMP)));
 
-            logger.info("Successfully generated PDF report for city: {} ({} bytes)", city, pdfData.length);
-            return new ResponseEntity<>(pdfData, headers, HttpStatus.OK);
+            logger.info("Streaming PDF report for city: {}", city);
+            return new ResponseEntity<>(pdfStream, headers, HttpStatus.OK);
 
         } catch (Exception e) {
             logger.error("Error generating PDF report for city {}: {}", city, e.getMessage(), e);
@@ -6,6 +6,7 @@ import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.GetMapping;
 import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RequestParam;
 import org.springframework.web.bind.annotation.RestController;
 
 import java.time.LocalDateTime;
@@ -15,7 +16,11 @@ import java.util.Map;
 @RestController
 @RequestMapping("/api")
 public class HealthController {
-    
+
+    // Fixed identity strings reported by every probe response
+    private static final String SERVICE_NAME = "AirSight Air Quality Monitoring";
+    private static final String SERVICE_VERSION = "1.0.0";
+
     @Autowired
     private AqiService aqiService;
     
@@ -23,16 +28,17 @@ public class HealthController {
     private OpenAQService openAQService;
     
     @GetMapping("/health")
-    public ResponseEntity<Map<String, Object>> health() {
+    public ResponseEntity<Map<String, Object>> health(
+            @RequestParam(value = "checkExternal", defaultValue = "false") boolean checkExternal) {
         Map<String, Object> health = new HashMap<>();
-        
+
         try {
             // Basic health check
             health.put("status", "UP");
             health.put("timestamp", LocalDateTime.now());
-            health.put("service", "AirSight Air Quality Monitoring");
-            health.put("version", "1.0.0");
-            
+            health.put("service", SERVICE_NAME);
+            health.put("version", SERVICE_VERSION);
+
             // Check database connectivity
             try {
                 long recordCount = aqiService.getTotalRecords();
@@ -42,18 +48,21 @@ public class HealthController {
                 health.put("database", "DOWN");
                 health.put("databaseError", e.getMessage());
             }
-            
-            // Check external API connectivity
-            try {
-                boolean apiConnected = openAQService.isApiHealthy();
-                health.put("externalAPI", apiConnected ? "UP" : "DOWN");
-            } catch (Exception e) {
-                health.put("externalAPI", "DOWN");
-                health.put("apiError", e.getMessage());
+
+            // External API connectivity is opt-in: routine liveness probes
+            // should not depend on (or wait for) a third-party service
+            if (checkExternal) {
+                try {
+                    boolean apiConnected = openAQService.isApiHealthy();
+                    health.put("externalAPI", apiConnected ? "UP" : "DOWN");
+                } catch (Exception e) {
+                    health.put("externalAPI", "DOWN");
+                    health.put("apiError", e.getMessage());
+                }
             }
-            
+
             // Check if any critical errors exist
-            boolean isHealthy = "UP".equals(health.get("database")) || 
+            boolean isHealthy = "UP".equals(health.get("database")) ||
                               "UP".equals(health.get("externalAPI"));
             
             if (!isHealthy) {
@@ -4,7 +4,12 @@ import javax.persistence.*;
 import java.time.LocalDateTime;
 
 @Entity
-@Table(name = "aqi_data")
+@Table(name = "aqi_data", indexes = {
+    // Backs the city + timestamp range/latest queries the repository relies on
+    @Index(name = "idx_city_timestamp", columnList = "city, timestamp"),
+    // Backs timestamp-only scans: cleanup, recent-data and health checks
+    @Index(name = "idx_timestamp", columnList = "timestamp")
+})
 public class AqiData {
     @Id
     @GeneratedValue(strategy = GenerationType.IDENTITY)
@@ -29,9 +29,14 @@ public interface AqiDataRepository extends JpaRepository<AqiData, Long> {
     
     // Non-paginated version for analytics
     @Query("SELECT a FROM AqiData a WHERE a.city = :city AND a.timestamp BETWEEN :startDate AND :endDate ORDER BY a.timestamp DESC")
-    List<AqiData> findByCityAndTimestampBetween(@Param("city") String city, 
-                                               @Param("startDate") LocalDateTime startDate, 
+    List<AqiData> findByCityAndTimestampBetween(@Param("city") String city,
+                                               @Param("startDate") LocalDateTime startDate,
                                                @Param("endDate") LocalDateTime endDate);
+
+    // Full history for a city in one round trip - callers can derive the date
+    // range from the first/last rows instead of issuing MIN/MAX queries first
+    @Query("SELECT a FROM AqiData a WHERE a.city = :city ORDER BY a.timestamp DESC")
+    List<AqiData> findByCityOrderByTimestampDesc(@Param("city") String city);
     
     // Optimized distinct cities query - using Spring Data pagination for limit
     @Query("SELECT DISTINCT a.city FROM AqiData a ORDER BY a.city")
@@ -76,6 +81,14 @@ public interface AqiDataRepository extends JpaRepository<AqiData, Long> {
                                       @Param("startDate") LocalDateTime startDate, 
                                       @Param("endDate") LocalDateTime endDate);
     
+    // Oldest date, newest date and record count in a single round trip for
+    // availability checks that need all three
+    @Query("SELECT MIN(a.timestamp), MAX(a.timestamp), COUNT(a) FROM AqiData a WHERE a.city = :city")
+    List<Object[]> findAvailabilitySummaryByCity(@Param("city") String city);
+
+    @Query("SELECT MIN(a.timestamp), MAX(a.timestamp), COUNT(a) FROM AqiData a")
+    List<Object[]> findAvailabilitySummary();
+
     // Data availability methods for analytics with optimized indexes
     @Query("SELECT MIN(a.timestamp) FROM AqiData a WHERE a.city = :city")
     Optional<LocalDateTime> findOldestDateByCity(@Param("city") String city);
@@ -92,7 +105,16 @@ public interface AqiDataRepository extends JpaRepository<AqiData, Long> {
     // Optimized count queries
     @Query("SELECT COUNT(a) FROM AqiData a WHERE a.city = :city")
     long countByCity(@Param("city") String city);
-    
+
+    // City count for health/status reporting without materializing the list
+    @Query("SELECT COUNT(DISTINCT a.city) FROM AqiData a")
+    long countDistinctCities();
+    
+    @Query("SELECT COUNT(a) FROM AqiData a WHERE a.city = :city AND a.timestamp BETWEEN :startDate AND :endDate")
+    long countByCityAndTimestampBetween(@Param("city") String city,
+                                        @Param("startDate") LocalDateTime startDate,
+                                        @Param("endDate") LocalDateTime endDate);
+
     // Bulk insert optimization hint
     @Query("SELECT COUNT(a) FROM AqiData a WHERE a.timestamp BETWEEN :startDate AND :endDate")
     long countByTimestampBetween(@Param("startDate") LocalDateTime startDate, 
@@ -10,7 +10,11 @@ import org.springframework.transaction.annotation.Transactional;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
+import org.springframework.data.domain.Page;
+import org.springframework.data.domain.PageRequest;
+
 import java.time.LocalDateTime;
+import java.util.ArrayList;
 import java.util.List;
 import java.util.Optional;
 import java.util.stream.Collectors;
@@ -41,6 +45,42 @@ public class AqiService {
                 .collect(Collectors.toList());
     }
     
+    public long countHistoricalData(String city, LocalDateTime startDate, LocalDateTime endDate) {
+        return aqiDataRepository.countByCityAndTimestampBetween(city, startDate, endDate);
+    }
+
+    /**
+     * Historical data for very large ranges: pages through the result set and
+     * applies stride sampling as rows are read, so at most maxPoints records
+     * (plus one page) are ever held in memory instead of the full range.
+     */
+    public List<AqiResponse> getSampledHistoricalData(String city, LocalDateTime startDate,
+                                                      LocalDateTime endDate, long totalRecords, int maxPoints) {
+        int step = (int) Math.max(1, totalRecords / maxPoints);
+        int pageSize = 5000;
+
+        List<AqiResponse> sampled = new ArrayList<>((int) (totalRecords / step) + 1);
+        long nextIndexToKeep = 0;
+        long offset = 0;
+        int pageNumber = 0;
+        Page<AqiData> page;
+        do {
+            page = aqiDataRepository.findByCityAndTimestampBetweenOrderByTimestampDesc(
+                    city, startDate, endDate, PageRequest.of(pageNumber, pageSize));
+            List<AqiData> content = page.getContent();
+            for (int i = 0; i < content.size(); i++) {
+                if (offset + i == nextIndexToKeep) {
+                    sampled.add(convertToResponse(content.get(i)));
+                    nextIndexToKeep += step;
+                }
+            }
+            offset += content.size();
+            pageNumber++;
+        } while (page.hasNext());
+
+        return sampled;
+    }
+
     public List<String> getAvailableCities() {
         return aqiDataRepository.findDistinctCities();
     }
@@ -94,22 +134,23 @@ public class AqiService {
     // Get data availability info for analytics
     public DataAvailabilityInfo getDataAvailabilityInfo(String city) {
         try {
-            Optional<LocalDateTime> oldestDate = city != null ? 
-                aqiDataRepository.findOldestDateByCity(city) : 
-                aqiDataRepository.findOldestDate();
-            Optional<LocalDateTime> newestDate = city != null ? 
-                aqiDataRepository.findNewestDateByCity(city) : 
-                aqiDataRepository.findNewestDate();
-            long recordCount = city != null ? 
-                aqiDataRepository.countByCity(city) : 
-                aqiDataRepository.count();
-            
-            return new DataAvailabilityInfo(
-                oldestDate.orElse(null),
-                newestDate.orElse(null),
-                recordCount,
-                city
-            );
+            // One aggregate query returns oldest date, newest date and record
+            // count together instead of three separate round trips
+            List<Object[]> rows = city != null ?
+                aqiDataRepository.findAvailabilitySummaryByCity(city) :
+                aqiDataRepository.findAvailabilitySummary();
+
+            if (rows != null && !rows.isEmpty()) {
+                Object[] row = rows.get(0);
+                return new DataAvailabilityInfo(
+                    (LocalDateTime) row[0],
+                    (LocalDateTime) row[1],
+                    row[2] != null ? ((Number) row[2]).longValue() : 0L,
+                    city
+                );
+            }
+
+            return new DataAvailabilityInfo(null, null, 0, city);
         } catch (Exception e) {
             logger.error("Error getting data availability info for city {}: {}", city, e.getMessage());
             return new DataAvailabilityInfo(null, null, 0, city);
@@ -130,23 +171,31 @@ public class AqiService {
         );
     }
     
-    // Health check methods for deployment readiness
+    // Health check methods for deployment readiness. Probes hit these every
+    // few seconds and both ran COUNT(*) on every call; one counted result is
+    // shared and reused for a short interval instead
+    private static final long HEALTH_CACHE_TTL_MS = 10 * 1000L;
+    private volatile long cachedTotalRecords = -1;
+    private volatile long cachedTotalRecordsTime = 0;
+
     public long getTotalRecords() {
+        if (System.currentTimeMillis() - cachedTotalRecordsTime < HEALTH_CACHE_TTL_MS) {
+            return cachedTotalRecords;
+        }
         try {
-            return aqiDataRepository.count();
+            long total = aqiDataRepository.count();
+            cachedTotalRecords = total;
+            cachedTotalRecordsTime = System.currentTimeMillis();
+            return total;
         } catch (Exception e) {
             logger.error("Error getting total records: {}", e.getMessage());
+            cachedTotalRecords = -1;
+            cachedTotalRecordsTime = System.currentTimeMillis();
             return -1;
         }
     }
-    
+
     public boolean isDatabaseReady() {
-        try {
-            aqiDataRepository.count();
-            return true;
-        } catch (Exception e) {
-            logger.error("Database not ready: {}", e.getMessage());
-            return false;
-        }
+        return getTotalRecords() >= 0;
     }
 }
\ No newline at end of file
@@ -89,12 +89,24 @@ public class HistoricalDataSeederService implements CommandLineRunner {
             List<AqiData> batchData = new ArrayList<>();
             int batchSize = 500; // Reduced batch size for better performance
             int totalRecords = 0;
-            
+            int seededCities = 0;
+            int skippedCities = 0;
+
             logger.info("Starting data generation with batch size: {}", batchSize);
             
             for (String city : cityProfiles.keySet()) {
-                logger.info("Generating historical data for {} from {} to {}", city, startDate, endDate);
-                
+                // Skip cities that were already seeded (or have real data) -
+                // a partial earlier run otherwise regenerates and re-inserts
+                // the full history for every city
+                long existingCityRecords = aqiDataRepository.countByCity(city);
+                if (existingCityRecords >= 1000) {
+                    logger.debug("City {} already has {} records, skipping generation", city, existingCityRecords);
+                    skippedCities++;
+                    continue;
+                }
+
+                logger.debug("Generating historical data for {} from {} to {}", city, startDate, endDate);
+
                 LocalDateTime currentTime = startDate;
                 CityProfile profile = cityProfiles.get(city);
                 int cityRecords = 0;
@@ -110,9 +122,9 @@ public class HistoricalDataSeederService implements CommandLineRunner {
                             aqiDataRepository.saveAll(batchData);
                             totalRecords += batchData.size();
                             batchData.clear();
-                            
+
                             if (totalRecords % 1000 == 0) {
-                                logger.info("Generated {} historical records so far...", totalRecords);
+                                logger.debug("Generated {} historical records so far...", totalRecords);
                             }
                         } catch (Exception e) {
                             logger.warn("Error saving batch of historical data: {}", e.getMessage());
@@ -124,7 +136,8 @@ public class HistoricalDataSeederService implements CommandLineRunner {
                     currentTime = currentTime.plusHours(12 + (int)(Math.random() * 12));
                 }
                 
-                logger.info("Generated {} records for city: {}", cityRecords, city);
+                logger.debug("Generated {} records for city: {}", cityRecords, city);
+                seededCities++;
             }
             
             // Save remaining data
@@ -137,7 +150,10 @@ public class HistoricalDataSeederService implements CommandLineRunner {
                 }
             }
             
-            logger.info("Generated {} total historical records for date range {} to {}", totalRecords, startDate, endDate);
+            // One summary line instead of a log entry per city/batch - the
+            // per-city detail is still available at debug level
+            logger.info("Generated {} total historical records for {} cities ({} skipped) over date range {} to {}",
+                totalRecords, seededCities, skippedCities, startDate, endDate);
         } finally {
             isSeeding = false;
         }
@@ -1,6 +1,9 @@
 package com.air.airquality.services;
 
+import com.air.airquality.util.LRUCacheWithTTL;
 import io.jsonwebtoken.Claims;
+import io.jsonwebtoken.ExpiredJwtException;
+import io.jsonwebtoken.JwtParser;
 import io.jsonwebtoken.Jwts;
 import io.jsonwebtoken.SignatureAlgorithm;
 import io.jsonwebtoken.security.Keys;
@@ -15,11 +18,24 @@ public class JwtService {
     // Use a secure, random, 32+ character secret key for JWT signing
     private static final String SECRET_KEY = "mySuperSecretKeyForJWTsThatIsAtLeast32Chars!";
     private static final long EXPIRATION_TIME = 1000 * 60 * 60 * 24; // 24 hours
-    
+
+    // Verified claims keyed by token - repeated requests with the same token
+    // skip the HMAC verification and base64 decode. The token's own expiry is
+    // still checked on every hit
+    private static final long CLAIMS_CACHE_TTL_MS = 5 * 60 * 1000L;
+    private final LRUCacheWithTTL<String, Claims> claimsCache =
+            new LRUCacheWithTTL<>(1000, CLAIMS_CACHE_TTL_MS);
+
     private final SecretKey signingKey;
-    
+    private final JwtParser jwtParser;
+
     public JwtService() {
         this.signingKey = Keys.hmacShaKeyFor(SECRET_KEY.getBytes(StandardCharsets.UTF_8));
+        // The parser is immutable and thread-safe - build it once instead of
+        // on every validation
+        this.jwtParser = Jwts.parserBuilder()
+                .setSigningKey(signingKey)
+                .build();
     }
 
     public String generateToken(Long userId, String username) {
@@ -33,11 +49,18 @@ public class JwtService {
     }
 
     public Claims validateToken(String token) {
-        return Jwts.parserBuilder()
-                .setSigningKey(signingKey)
-                .build()
-                .parseClaimsJws(token)
-                .getBody();
+        Claims cached = claimsCache.get(token);
+        if (cached != null) {
+            if (cached.getExpiration() != null && cached.getExpiration().before(new Date())) {
+                claimsCache.remove(token);
+                throw new ExpiredJwtException(null, cached, "JWT expired");
+            }
+            return cached;
+        }
+
+        Claims claims = jwtParser.parseClaimsJws(token).getBody();
+        claimsCache.put(token, claims);
+        return claims;
     }
 
     public Long getUserIdFromToken(String token) {
@@ -3,10 +3,12 @@ package com.air.airquality.services;
 import com.air.airquality.dto.OpenAQResponse;
 import com.air.airquality.model.AqiData;
 import com.air.airquality.repository.AqiDataRepository;
+import com.air.airquality.util.CityNameUtil;
 import com.air.airquality.util.LRUCacheWithTTL;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.beans.factory.annotation.Value;
 import org.springframework.http.ResponseEntity;
+import org.springframework.http.client.SimpleClientHttpRequestFactory;
 import org.springframework.stereotype.Service;
 import org.springframework.web.client.RestTemplate;
 import org.springframework.web.client.RestClientException;
@@ -31,9 +33,12 @@ public class OpenAQService {
     
     @Value("${openaq.api.url:https://api.openaq.org/v2/latest}")
     private String openAQApiUrl;
-    
-    private final RestTemplate restTemplate = new RestTemplate();
-    
+
+    @Value("${openaq.api.timeout:10000}")
+    private int apiTimeoutMs;
+
+    private RestTemplate restTemplate;
+
     // Thread pool for concurrent API calls
     private ExecutorService executorService;
     
@@ -55,9 +60,23 @@ public class OpenAQService {
         put("new york", 45); put("london", 52); put("paris", 63); put("tokyo", 41);
         put("beijing", 187); put("sydney", 38); put("singapore", 55); put("dubai", 82);
     }};
+
+    // Display-form fallback city list, normalized and sorted once instead of
+    // on every call that falls back to it
+    private static final List<String> FALLBACK_CITIES = FALLBACK_AQI.keySet().stream()
+            .map(CityNameUtil::normalize)
+            .sorted()
+            .collect(Collectors.toList());
     
     // Cache for recent API calls - optimized with time-based eviction
     private LRUCacheWithTTL<String, CachedAqiData> apiCache = new LRUCacheWithTTL<>(1000, 300000);
+
+    // City list changes only when a new city is added, yet every dashboard
+    // load and search hits it - cache for a short interval and invalidate
+    // explicitly when a city is added
+    private static final long CITIES_CACHE_TTL_MS = 5 * 60 * 1000L;
+    private volatile List<String> cachedCities;
+    private volatile long cachedCitiesTime = 0;
     
     // Complete fallback data for when API is unavailable - using the integer AQI values
     private static final Map<String, AqiData> FALLBACK_DATA = new ConcurrentHashMap<String, AqiData>() {{
@@ -85,8 +104,13 @@ public class OpenAQService {
     
     @PostConstruct
     public void init() {
-        // Initialize thread pool for concurrent processing
-        
+        // Configure HTTP timeouts so a slow or unresponsive OpenAQ endpoint
+        // cannot hold worker threads indefinitely (the default is no timeout)
+        SimpleClientHttpRequestFactory requestFactory = new SimpleClientHttpRequestFactory();
+        requestFactory.setConnectTimeout(apiTimeoutMs);
+        requestFactory.setReadTimeout(apiTimeoutMs);
+        restTemplate = new RestTemplate(requestFactory);
+
         // Initialize thread pool for concurrent processing
         executorService = new ThreadPoolExecutor(
             5, // core threads
@@ -186,6 +210,18 @@ public class OpenAQService {
     }
 
     public List<String> getAvailableCities() {
+        List<String> cities = cachedCities;
+        if (cities != null && System.currentTimeMillis() - cachedCitiesTime < CITIES_CACHE_TTL_MS) {
+            return cities;
+        }
+
+        cities = loadAvailableCities();
+        cachedCities = cities;
+        cachedCitiesTime = System.currentTimeMillis();
+        return cities;
+    }
+
+    private List<String> loadAvailableCities() {
         try {
             // Use pagination for better performance with large datasets
             org.springframework.data.domain.PageRequest pageRequest = 
@@ -194,23 +230,17 @@ public class OpenAQService {
                 aqiDataRepository.findDistinctCities(pageRequest);
             
             if (cityPage.hasContent()) {
-                return cityPage.getContent().stream()
-                        .sorted(String.CASE_INSENSITIVE_ORDER)
-                        .collect(Collectors.toList());
+                // The query already orders by city, so the page content can be
+                // returned as-is without a second in-memory sort
+                return cityPage.getContent();
             }
             
             // Return fallback cities if database is empty
-            return FALLBACK_AQI.keySet().stream()
-                    .map(this::capitalizeCity)
-                    .sorted()
-                    .collect(Collectors.toList());
-                    
+            return FALLBACK_CITIES;
+
         } catch (Exception e) {
             logger.error("Error getting cities from database: {}", e.getMessage());
-            return FALLBACK_AQI.keySet().stream()
-                    .map(this::capitalizeCity)
-                    .sorted()
-                    .collect(Collectors.toList());
+            return FALLBACK_CITIES;
         }
     }
 
@@ -222,8 +252,10 @@ public class OpenAQService {
         String normalizedQuery = query.toLowerCase().trim();
         List<String> allCities = getAvailableCities();
         
-        // Use parallel stream for faster processing with large city lists
-        return allCities.parallelStream()
+        // The city list is capped at 100 entries, so a sequential stream beats
+        // the fork/join overhead of parallelStream here; limit() also stays
+        // cheap without the ordered-parallel coordination it needs otherwise
+        return allCities.stream()
                 .filter(city -> city.toLowerCase().contains(normalizedQuery))
                 .limit(10)
                 .collect(Collectors.toList());
@@ -242,14 +274,16 @@ public class OpenAQService {
             AqiData testData = fetchFromAPI(normalizedCity);
             if (testData != null) {
                 saveToDatabase(testData);
+                cachedCities = null; // new city - refresh the cached list
                 return true;
             }
-            
+
             // If API fails, add with fallback data
             AqiData fallbackData = generateFallbackData(normalizedCity);
             saveToDatabase(fallbackData);
+            cachedCities = null;
             return true;
-            
+
         } catch (Exception e) {
             logger.error("Error adding city {}: {}", city, e.getMessage());
             return false;
@@ -430,15 +464,11 @@ public class OpenAQService {
     }
 
     private String normalizeCity(String city) {
-        return Arrays.stream(city.toLowerCase().trim().split("\\s+"))
-                .map(word -> word.substring(0, 1).toUpperCase() + word.substring(1))
-                .collect(Collectors.joining(" "));
+        return CityNameUtil.normalize(city);
     }
 
     private String capitalizeCity(String city) {
-        return Arrays.stream(city.split("\\s+"))
-                .map(word -> word.substring(0, 1).toUpperCase() + word.substring(1).toLowerCase())
-                .collect(Collectors.joining(" "));
+        return CityNameUtil.normalize(city);
     }
 
     // Optimized AQI calculation using binary search approach
@@ -469,49 +499,16 @@ public class OpenAQService {
         }
     }
     
-    @SuppressWarnings("null")
     public void fetchAndStoreAqiData(String city) {
         try {
-            AqiData aqiData = null;
-            
-            // First try to fetch from OpenAQ API
-            try {
-                String url = openAQApiUrl + "?city=" + city + "&limit=1&parameter=pm25,pm10,no2,so2,co,o3";
-                logger.info("Fetching AQI data for city: {} from URL: {}", city, url);
-                
-                ResponseEntity<OpenAQResponse> response = restTemplate.getForEntity(url, OpenAQResponse.class);
-                
-                if (response.getStatusCode() == HttpStatus.OK && 
-                    response.getBody() != null && 
-                    !response.getBody().getResults().isEmpty()) {
-                    
-                    OpenAQResponse.OpenAQResult result = response.getBody().getResults().get(0);
-                    
-                    Map<String, Double> pollutants = new HashMap<>();
-                    for (OpenAQResponse.Measurement measurement : result.getMeasurements()) {
-                        pollutants.put(measurement.getParameter().toLowerCase(), measurement.getValue());
-                    }
-                    
-                    // Calculate AQI based on PM2.5 (US EPA standard)
-                    Integer aqiValue = calculateAQI(pollutants.get("pm25"));
-                    
-                    aqiData = new AqiData(
-                        result.getCity(),
-                        aqiValue,
-                        pollutants.get("pm25"),
-                        pollutants.get("pm10"),
-                        pollutants.get("no2"),
-                        pollutants.get("so2"),
-                        pollutants.get("co"),
-                        pollutants.get("o3")
-                    );
-                    
-                    logger.info("Successfully fetched data from OpenAQ API for city: {}", city);
-                }
-            } catch (RestClientException e) {
-                logger.warn("Failed to fetch from OpenAQ API for city: {}. Error: {}", city, e.getMessage());
+            // First try to fetch from OpenAQ API via the shared fetch/parse
+            // path - this method previously carried its own copy of the
+            // measurement-parsing loop
+            AqiData aqiData = fetchFromAPI(city);
+            if (aqiData != null) {
+                logger.info("Successfully fetched data from OpenAQ API for city: {}", city);
             }
-            
+
             // If API call failed, use fallback data with some variation
             if (aqiData == null && FALLBACK_DATA.containsKey(city)) {
                 AqiData fallbackData = FALLBACK_DATA.get(city);
@@ -546,16 +543,32 @@ public class OpenAQService {
         }
     }
     
-    // Health check method for deployment readiness
+    // Health check method for deployment readiness. Liveness/readiness probes
+    // call this every few seconds; the cached verdict keeps them from issuing
+    // an external HTTP request per probe
+    private static final long API_HEALTH_CACHE_TTL_MS = 30 * 1000L;
+    private volatile Boolean cachedApiHealthy;
+    private volatile long cachedApiHealthyTime = 0;
+
     public boolean isApiHealthy() {
+        Boolean cached = cachedApiHealthy;
+        if (cached != null && System.currentTimeMillis() - cachedApiHealthyTime < API_HEALTH_CACHE_TTL_MS) {
+            return cached;
+        }
+
+        boolean healthy;
         try {
             // Test API connectivity with a simple request
             String testUrl = "https://api.openaq.org/v2/locations?limit=1";
             ResponseEntity<OpenAQResponse> response = restTemplate.getForEntity(testUrl, OpenAQResponse.class);
-            return response.getStatusCode().is2xxSuccessful();
+            healthy = response.getStatusCode().is2xxSuccessful();
         } catch (Exception e) {
             logger.debug("API health check failed: {}", e.getMessage());
-            return false;
+            healthy = false;
         }
+
+        cachedApiHealthy = healthy;
+        cachedApiHealthyTime = System.currentTimeMillis();
+        return healthy;
     }
 }
@@ -2,6 +2,7 @@ package com.air.airquality.services;
 
 import com.air.airquality.model.AqiData;
 import com.air.airquality.repository.AqiDataRepository;
+import com.air.airquality.util.LRUCacheWithTTL;
 import com.itextpdf.kernel.colors.ColorConstants;
 import com.itextpdf.kernel.colors.DeviceRgb;
 import com.itextpdf.kernel.pdf.PdfDocument;
@@ -12,11 +13,15 @@ import com.itextpdf.layout.element.*;
 import com.itextpdf.layout.properties.TextAlignment;
 import com.itextpdf.layout.properties.UnitValue;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.annotation.Qualifier;
 import org.springframework.stereotype.Service;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
+import javax.annotation.PostConstruct;
+
 import java.io.ByteArrayOutputStream;
+import java.io.OutputStream;
 import java.time.LocalDateTime;
 import java.time.format.DateTimeFormatter;
 import java.util.*;
@@ -28,26 +33,188 @@ public class PdfGenerationService {
 
     private static final Logger logger = LoggerFactory.getLogger(PdfGenerationService.class);
 
+    // Shared AQI level lookup tables - one index lookup resolves both the level
+    // name and its colour instead of walking separate if-else/switch chains
+    private static final int[] AQI_LEVEL_UPPER_BOUNDS = {50, 100, 150, 200, 300};
+    private static final String[] AQI_LEVEL_NAMES = {
+            "Good", "Moderate", "Unhealthy for Sensitive Groups",
+            "Unhealthy", "Very Unhealthy", "Hazardous"
+    };
+    // Formatters and table header colour are immutable - build them once
+    // instead of on every report/row
+    private static final DateTimeFormatter DATE_TIME_FORMATTER = DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm");
+    private static final DateTimeFormatter ROW_TIMESTAMP_FORMATTER = DateTimeFormatter.ofPattern("MM/dd HH:mm");
+    private static final DeviceRgb HEADER_BACKGROUND = new DeviceRgb(230, 230, 230);
+
+    private static final DeviceRgb[] AQI_LEVEL_COLORS = {
+            new DeviceRgb(0, 228, 0),
+            new DeviceRgb(255, 255, 0),
+            new DeviceRgb(255, 126, 0),
+            new DeviceRgb(255, 0, 0),
+            new DeviceRgb(143, 63, 151),
+            new DeviceRgb(126, 0, 35)
+    };
+
+    // Health recommendations aligned with AQI_LEVEL_NAMES by index - the
+    // lists are immutable, so build them once instead of per report
+    private static final java.util.List<java.util.List<String>> HEALTH_RECOMMENDATIONS = Arrays.asList(
+            Arrays.asList(
+                    "Air quality is excellent - ideal for all outdoor activities",
+                    "Perfect time for exercise, sports, and outdoor recreation",
+                    "No health precautions necessary for any group"
+            ),
+            Arrays.asList(
+                    "Air quality is acceptable for most people",
+                    "Unusually sensitive individuals may experience minor symptoms",
+                    "Outdoor activities are generally safe for healthy individuals",
+                    "Consider reducing prolonged outdoor exertion if sensitive to air pollution"
+            ),
+            Arrays.asList(
+                    "Sensitive groups (children, elderly, people with heart/lung disease) should limit outdoor activities",
+                    "Healthy individuals can continue normal outdoor activities",
+                    "Consider indoor exercise alternatives if you're in a sensitive group",
+                    "Watch for symptoms like coughing, throat irritation, or breathing difficulty"
+            ),
+            Arrays.asList(
+                    "Everyone should limit prolonged outdoor exertion",
+                    "Sensitive groups should avoid outdoor activities entirely",
+                    "Consider wearing N95 masks when outdoors",
+                    "Keep windows closed and use air purifiers if available",
+                    "Reschedule outdoor events if possible"
+            ),
+            Arrays.asList(
+                    "Avoid all outdoor activities",
+                    "Everyone should stay indoors with windows and doors closed",
+                    "Use air purifiers and avoid using anything that creates more particles indoors",
+                    "Wear N95 masks if you must go outside",
+                    "Seek medical attention if experiencing breathing difficulties"
+            ),
+            Arrays.asList(
+                    "EMERGENCY CONDITIONS: Everyone should stay indoors",
+                    "Avoid all outdoor activities completely",
+                    "Keep windows and doors sealed shut",
+                    "Use high-efficiency air purifiers if available",
+                    "Seek immediate medical attention for any respiratory symptoms",
+                    "Consider evacuation if conditions persist"
+            )
+    );
+
+    // Fixed report copy - built once at class load like the recommendation
+    // lists above, rather than re-allocated on every report
+    private static final java.util.List<String> GENERAL_HEALTH_GUIDELINES = Arrays.asList(
+            "Monitor air quality regularly, especially if you have respiratory conditions",
+            "Keep windows closed during high pollution periods",
+            "Use air purifiers indoors when possible",
+            "Avoid outdoor exercise during poor air quality periods",
+            "Consider wearing N95 masks when air quality is unhealthy",
+            "Stay hydrated and maintain a healthy diet rich in antioxidants",
+            "Consult healthcare providers if you experience breathing difficulties"
+    );
+
+    private static final java.util.List<String> NO_DATA_SUGGESTIONS = Arrays.asList(
+            "Verify the city name spelling",
+            "Check if data collection has been set up for this location",
+            "Try a different date range",
+            "Contact support for assistance with data availability"
+    );
+
     @Autowired
     private AqiDataRepository aqiDataRepository;
 
+    // Finished reports keyed by city and date range - a repeat request within
+    // the TTL skips the database query and the whole PDF render. Source data
+    // is refreshed hourly, so 15 minutes of staleness is acceptable
+    private static final long REPORT_CACHE_TTL_MS = 15 * 60 * 1000L;
+    private final LRUCacheWithTTL<String, byte[]> reportCache =
+            new LRUCacheWithTTL<>(32, REPORT_CACHE_TTL_MS);
+
+    @Autowired
+    @Qualifier("taskExecutor")
+    private java.util.concurrent.Executor taskExecutor;
+
+    /**
+     * Renders a throwaway document once at startup so iText's class loading
+     * and font initialization are paid on a background thread instead of by
+     * the first user to request a report.
+     */
+    @PostConstruct
+    public void warmUpPdfPipeline() {
+        taskExecutor.execute(() -> {
+            try {
+                ByteArrayOutputStream warmup = new ByteArrayOutputStream();
+                generateNoDataReport("warmup", LocalDateTime.now().minusDays(1), LocalDateTime.now(), warmup);
+                logger.info("PDF pipeline warmed up ({} bytes)", warmup.size());
+            } catch (Exception e) {
+                // Warm-up is best-effort; real requests just pay the init cost
+                logger.warn("PDF pipeline warm-up failed: {}", e.getMessage());
+            }
+        });
+    }
+
+    private static int getAqiLevelIndex(int aqi) {
+        for (int i = 0; i < AQI_LEVEL_UPPER_BOUNDS.length; i++) {
+            if (aqi <= AQI_LEVEL_UPPER_BOUNDS[i]) {
+                return i;
+            }
+        }
+        return AQI_LEVEL_NAMES.length - 1; // Hazardous
+    }
+
     public byte[] generateAirQualityReport(String city, LocalDateTime startDate, LocalDateTime endDate) {
+        ByteArrayOutputStream outputStream = new ByteArrayOutputStream();
+        generateAirQualityReport(city, startDate, endDate, outputStream);
+        return outputStream.toByteArray();
+    }
+
+    /**
+     * Writes the report to the supplied stream. Finished reports are kept in
+     * a short-TTL cache, so a repeat request for the same city and date range
+     * is served from memory without touching the database or iText.
+     */
+    public void generateAirQualityReport(String city, LocalDateTime startDate, LocalDateTime endDate,
+                                         OutputStream outputStream) {
+        String cacheKey = city + "|" + startDate + "|" + endDate;
+        byte[] cached = reportCache.get(cacheKey);
+        if (cached != null) {
+            try {
+                outputStream.write(cached);
+                return;
+            } catch (Exception e) {
+                logger.error("Error writing cached PDF report for city {}: {}", city, e.getMessage(), e);
+                throw new RuntimeException("Failed to generate PDF report: " + e.getMessage(), e);
+            }
+        }
+
+        ByteArrayOutputStream capture = new ByteArrayOutputStream();
+        renderAirQualityReport(city, startDate, endDate, capture);
+        byte[] pdfBytes = capture.toByteArray();
+        reportCache.put(cacheKey, pdfBytes);
+        try {
+            outputStream.write(pdfBytes);
+        } catch (Exception e) {
+            logger.error("Error writing PDF report for city {}: {}", city, e.getMessage(), e);
+            throw new RuntimeException("Failed to generate PDF report: " + e.getMessage(), e);
+        }
+    }
+
+    private void renderAirQualityReport(String city, LocalDateTime startDate, LocalDateTime endDate,
+                                        OutputStream outputStream) {
         try {
             // Fetch data from database
             java.util.List<AqiData> aqiDataList;
             
             if (startDate == null || endDate == null) {
-                // If no date range provided, get all data for the city
+                // If no date range provided, get all data for the city in a
+                // single query; the rows are ordered newest-first, so the
+                // report period falls out of the first and last rows instead
+                // of two extra MIN/MAX round trips
                 logger.info("Generating PDF report for city: {} for all available data", city);
-                
-                // Find the actual date range for this city
-                Optional<LocalDateTime> oldestDate = aqiDataRepository.findOldestDateByCity(city);
-                Optional<LocalDateTime> newestDate = aqiDataRepository.findNewestDateByCity(city);
-                
-                if (oldestDate.isPresent() && newestDate.isPresent()) {
-                    startDate = oldestDate.get();
-                    endDate = newestDate.get();
-                    aqiDataList = aqiDataRepository.findByCityAndTimestampBetween(city, startDate, endDate);
+
+                aqiDataList = aqiDataRepository.findByCityOrderByTimestampDesc(city);
+
+                if (aqiDataList != null && !aqiDataList.isEmpty()) {
+                    endDate = aqiDataList.get(0).getTimestamp();
+                    startDate = aqiDataList.get(aqiDataList.size() - 1).getTimestamp();
                 } else {
                     // No data for this city
                     startDate = LocalDateTime.now().minusDays(30);
@@ -61,36 +228,39 @@ public class PdfGenerationService {
 
             if (aqiDataList.isEmpty()) {
                 logger.warn("No data found for city: {} in the specified date range", city);
-                return generateNoDataReport(city, startDate, endDate);
+                generateNoDataReport(city, startDate, endDate, outputStream);
+                return;
             }
 
-            ByteArrayOutputStream outputStream = new ByteArrayOutputStream();
             PdfWriter writer = new PdfWriter(outputStream);
             PdfDocument pdfDoc = new PdfDocument(writer);
             Document document = new Document(pdfDoc);
 
+            // Compute the shared aggregates once and hand them to each section
+            // instead of every section re-scanning the full list
+            IntSummaryStatistics aqiStats = aqiDataList.stream().mapToInt(AqiData::getAqiValue).summaryStatistics();
+            int[] aqiLevelCounts = getAqiLevelCounts(aqiDataList);
+
             // Add title and header
             addReportHeader(document, city, startDate, endDate, aqiDataList.size());
 
             // Add executive summary
-            addExecutiveSummary(document, aqiDataList);
+            addExecutiveSummary(document, aqiDataList, aqiStats, aqiLevelCounts);
 
             // Add detailed statistics
-            addDetailedStatistics(document, aqiDataList);
+            addDetailedStatistics(document, aqiDataList, aqiStats, aqiLevelCounts);
 
             // Add data table
             addDataTable(document, aqiDataList);
 
             // Add health recommendations
-            addHealthRecommendations(document, aqiDataList);
+            addHealthRecommendations(document, aqiStats);
 
             // Add footer
             addReportFooter(document);
 
             document.close();
-            logger.info("PDF report generated successfully for city: {} ({} bytes)", city, outputStream.size());
-
-            return outputStream.toByteArray();
+            logger.info("PDF report generated successfully for city: {}", city);
 
         } catch (Exception e) {
             logger.error("Error generating PDF report for city {}: {}", city, e.getMessage(), e);
@@ -121,17 +291,15 @@ public class PdfGenerationService {
                 .setWidth(UnitValue.createPercentValue(100))
                 .setMarginBottom(20);
 
-        DateTimeFormatter formatter = DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm");
-        
         infoTable.addCell(createInfoCell("Report Period:"));
-        infoTable.addCell(createInfoCell(String.format("%s to %s", 
-                startDate.format(formatter), endDate.format(formatter))));
-        
+        infoTable.addCell(createInfoCell(String.format("%s to %s",
+                startDate.format(DATE_TIME_FORMATTER), endDate.format(DATE_TIME_FORMATTER))));
+
         infoTable.addCell(createInfoCell("Total Records:"));
         infoTable.addCell(createInfoCell(String.valueOf(recordCount)));
-        
+
         infoTable.addCell(createInfoCell("Generated On:"));
-        infoTable.addCell(createInfoCell(LocalDateTime.now().format(formatter)));
+        infoTable.addCell(createInfoCell(LocalDateTime.now().format(DATE_TIME_FORMATTER)));
 
         document.add(infoTable);
     }
@@ -142,31 +310,29 @@ public class PdfGenerationService {
                 .setPadding(5);
     }
 
-    private void addExecutiveSummary(Document document, java.util.List<AqiData> aqiDataList) {
+    private void addExecutiveSummary(Document document, java.util.List<AqiData> aqiDataList,
+                                     IntSummaryStatistics aqiStats, int[] aqiLevelCounts) {
         document.add(new Paragraph("Executive Summary")
                 .setFontSize(16)
                 .setBold()
                 .setMarginTop(20)
                 .setMarginBottom(10));
 
-        // Calculate basic statistics
-        OptionalDouble avgAqi = aqiDataList.stream().mapToInt(AqiData::getAqiValue).average();
-        OptionalInt maxAqi = aqiDataList.stream().mapToInt(AqiData::getAqiValue).max();
-        OptionalInt minAqi = aqiDataList.stream().mapToInt(AqiData::getAqiValue).min();
-
-        Map<String, Integer> aqiLevelCounts = getAqiLevelCounts(aqiDataList);
-
         Paragraph summary = new Paragraph()
                 .add(String.format("This report analyzes %d air quality measurements. ", aqiDataList.size()))
-                .add(String.format("The average AQI during this period was %.1f, ", avgAqi.orElse(0.0)))
-                .add(String.format("with values ranging from %d to %d. ", minAqi.orElse(0), maxAqi.orElse(0)))
+                .add(String.format("The average AQI during this period was %.1f, ", aqiStats.getAverage()))
+                .add(String.format("with values ranging from %d to %d. ",
+                        aqiStats.getCount() > 0 ? aqiStats.getMin() : 0,
+                        aqiStats.getCount() > 0 ? aqiStats.getMax() : 0))
                 .add(getDominantAqiLevelText(aqiLevelCounts))
+                .add(" " + getAqiTrendText(aqiDataList))
                 .setMarginBottom(15);
 
         document.add(summary);
     }
 
-    private void addDetailedStatistics(Document document, java.util.List<AqiData> aqiDataList) {
+    private void addDetailedStatistics(Document document, java.util.List<AqiData> aqiDataList,
+                                       IntSummaryStatistics aqiStats, int[] aqiLevelCounts) {
         document.add(new Paragraph("Detailed Statistics")
                 .setFontSize(16)
                 .setBold()
@@ -184,61 +350,55 @@ public class PdfGenerationService {
         statsTable.addHeaderCell(createStatsHeaderCell("Minimum"));
         statsTable.addHeaderCell(createStatsHeaderCell("Maximum"));
 
-        // AQI
-        OptionalDouble avgAqi = aqiDataList.stream().mapToInt(AqiData::getAqiValue).average();
-        OptionalInt minAqi = aqiDataList.stream().mapToInt(AqiData::getAqiValue).min();
-        OptionalInt maxAqi = aqiDataList.stream().mapToInt(AqiData::getAqiValue).max();
-        addStatsRow(statsTable, "AQI", 
-                String.format("%.1f", avgAqi.orElse(0.0)),
-                String.valueOf(minAqi.orElse(0)),
-                String.valueOf(maxAqi.orElse(0)));
-
-        // PM2.5
-        java.util.List<AqiData> pm25Data = aqiDataList.stream().filter(d -> d.getPm25() != null).collect(Collectors.toList());
-        addPollutantStatsFromList(statsTable, "PM2.5 (μg/m³)", pm25Data, AqiData::getPm25);
-
-        // PM10
-        java.util.List<AqiData> pm10Data = aqiDataList.stream().filter(d -> d.getPm10() != null).collect(Collectors.toList());
-        addPollutantStatsFromList(statsTable, "PM10 (μg/m³)", pm10Data, AqiData::getPm10);
-
-        // NO2
-        java.util.List<AqiData> no2Data = aqiDataList.stream().filter(d -> d.getNo2() != null).collect(Collectors.toList());
-        addPollutantStatsFromList(statsTable, "NO2 (ppb)", no2Data, AqiData::getNo2);
-
-        // SO2
-        java.util.List<AqiData> so2Data = aqiDataList.stream().filter(d -> d.getSo2() != null).collect(Collectors.toList());
-        addPollutantStatsFromList(statsTable, "SO2 (ppb)", so2Data, AqiData::getSo2);
-
-        // CO
-        java.util.List<AqiData> coData = aqiDataList.stream().filter(d -> d.getCo() != null).collect(Collectors.toList());
-        addPollutantStatsFromList(statsTable, "CO (ppm)", coData, AqiData::getCo);
+        // AQI - aggregates are computed once per report and passed in
+        addStatsRow(statsTable, "AQI",
+                String.format("%.1f", aqiStats.getAverage()),
+                String.valueOf(aqiStats.getCount() > 0 ? aqiStats.getMin() : 0),
+                String.valueOf(aqiStats.getCount() > 0 ? aqiStats.getMax() : 0));
 
-        // O3
-        java.util.List<AqiData> o3Data = aqiDataList.stream().filter(d -> d.getO3() != null).collect(Collectors.toList());
-        addPollutantStatsFromList(statsTable, "O3 (ppb)", o3Data, AqiData::getO3);
+        addPollutantStats(statsTable, aqiDataList);
 
         document.add(statsTable);
 
         // AQI Level Distribution
-        addAqiLevelDistribution(document, aqiDataList);
+        addAqiLevelDistribution(document, aqiLevelCounts, aqiDataList.size());
     }
 
-    private void addPollutantStatsFromList(Table table, String pollutant, 
-                                           java.util.List<AqiData> dataList, 
-                                           java.util.function.Function<AqiData, Double> valueExtractor) {
-        OptionalDouble avg = dataList.stream().mapToDouble(d -> valueExtractor.apply(d)).average();
-        OptionalDouble min = dataList.stream().mapToDouble(d -> valueExtractor.apply(d)).min();
-        OptionalDouble max = dataList.stream().mapToDouble(d -> valueExtractor.apply(d)).max();
-
-        addStatsRow(table, pollutant,
-                avg.isPresent() ? String.format("%.2f", avg.getAsDouble()) : "N/A",
-                min.isPresent() ? String.format("%.2f", min.getAsDouble()) : "N/A",
-                max.isPresent() ? String.format("%.2f", max.getAsDouble()) : "N/A");
+    private void addPollutantStats(Table table, java.util.List<AqiData> aqiDataList) {
+        // One traversal over the data for all six pollutants: each record is
+        // read once and its readings fan out into per-pollutant accumulators,
+        // instead of six separate passes over the list
+        String[] labels = {"PM2.5 (μg/m³)", "PM10 (μg/m³)", "NO2 (ppb)", "SO2 (ppb)", "CO (ppm)", "O3 (ppb)"};
+        List<java.util.function.Function<AqiData, Double>> extractors = Arrays.asList(
+                AqiData::getPm25, AqiData::getPm10, AqiData::getNo2,
+                AqiData::getSo2, AqiData::getCo, AqiData::getO3);
+
+        DoubleSummaryStatistics[] stats = new DoubleSummaryStatistics[labels.length];
+        for (int i = 0; i < stats.length; i++) {
+            stats[i] = new DoubleSummaryStatistics();
+        }
+
+        for (AqiData data : aqiDataList) {
+            for (int i = 0; i < stats.length; i++) {
+                Double value = extractors.get(i).apply(data);
+                if (value != null) {
+                    stats[i].accept(value);
+                }
+            }
+        }
+
+        for (int i = 0; i < stats.length; i++) {
+            boolean hasValues = stats[i].getCount() > 0;
+            addStatsRow(table, labels[i],
+                    hasValues ? String.format("%.2f", stats[i].getAverage()) : "N/A",
+                    hasValues ? String.format("%.2f", stats[i].getMin()) : "N/A",
+                    hasValues ? String.format("%.2f", stats[i].getMax()) : "N/A");
+        }
     }
 
     private Cell createStatsHeaderCell(String text) {
         return new Cell().add(new Paragraph(text).setBold())
-                .setBackgroundColor(new DeviceRgb(230, 230, 230))
+                .setBackgroundColor(HEADER_BACKGROUND)
                 .setPadding(8)
                 .setTextAlignment(TextAlignment.CENTER);
     }
@@ -250,9 +410,7 @@ public class PdfGenerationService {
         table.addCell(new Cell().add(new Paragraph(max)).setPadding(5).setTextAlignment(TextAlignment.CENTER));
     }
 
-    private void addAqiLevelDistribution(Document document, java.util.List<AqiData> aqiDataList) {
-        Map<String, Integer> levelCounts = getAqiLevelCounts(aqiDataList);
-        
+    private void addAqiLevelDistribution(Document document, int[] levelCounts, int total) {
         document.add(new Paragraph("AQI Level Distribution")
                 .setFontSize(14)
                 .setBold()
@@ -267,15 +425,13 @@ public class PdfGenerationService {
         levelTable.addHeaderCell(createStatsHeaderCell("Count"));
         levelTable.addHeaderCell(createStatsHeaderCell("Percentage"));
 
-        int total = aqiDataList.size();
-        for (Map.Entry<String, Integer> entry : levelCounts.entrySet()) {
-            String level = entry.getKey();
-            int count = entry.getValue();
+        for (int i = 0; i < levelCounts.length; i++) {
+            int count = levelCounts[i];
             double percentage = (count * 100.0) / total;
-            
-            Cell levelCell = new Cell().add(new Paragraph(level)).setPadding(5);
-            levelCell.setBackgroundColor(getAqiLevelColor(level));
-            
+
+            Cell levelCell = new Cell().add(new Paragraph(AQI_LEVEL_NAMES[i])).setPadding(5);
+            levelCell.setBackgroundColor(AQI_LEVEL_COLORS[i]);
+
             levelTable.addCell(levelCell);
             levelTable.addCell(new Cell().add(new Paragraph(String.valueOf(count)))
                     .setPadding(5).setTextAlignment(TextAlignment.CENTER));
@@ -308,11 +464,10 @@ public class PdfGenerationService {
         dataTable.addHeaderCell(createStatsHeaderCell("O3"));
 
         // Data rows (limit to most recent 20)
-        DateTimeFormatter formatter = DateTimeFormatter.ofPattern("MM/dd HH:mm");
         java.util.List<AqiData> recentData = aqiDataList.stream().limit(20).collect(Collectors.toList());
-        
+
         for (AqiData data : recentData) {
-            dataTable.addCell(new Cell().add(new Paragraph(data.getTimestamp().format(formatter))).setPadding(3));
+            dataTable.addCell(new Cell().add(new Paragraph(data.getTimestamp().format(ROW_TIMESTAMP_FORMATTER))).setPadding(3));
             
             Cell aqiCell = new Cell().add(new Paragraph(String.valueOf(data.getAqiValue())))
                     .setPadding(3).setTextAlignment(TextAlignment.CENTER);
@@ -337,26 +492,25 @@ public class PdfGenerationService {
                 .setTextAlignment(TextAlignment.CENTER);
     }
 
-    private void addHealthRecommendations(Document document, java.util.List<AqiData> aqiDataList) {
+    private void addHealthRecommendations(Document document, IntSummaryStatistics aqiStats) {
         document.add(new Paragraph("Health Recommendations & Precautions")
                 .setFontSize(16)
                 .setBold()
                 .setMarginTop(20)
                 .setMarginBottom(10));
 
-        // Determine current air quality level
-        OptionalDouble avgAqi = aqiDataList.stream().mapToInt(AqiData::getAqiValue).average();
-        String currentLevel = getAqiLevel((int) avgAqi.orElse(0));
+        // Determine current air quality level from the precomputed average
+        int levelIndex = getAqiLevelIndex((int) aqiStats.getAverage());
 
         // Add current status
         Paragraph status = new Paragraph()
                 .add("Current Air Quality Status: ")
-                .add(new Text(currentLevel).setBold())
+                .add(new Text(AQI_LEVEL_NAMES[levelIndex]).setBold())
                 .setMarginBottom(10);
         document.add(status);
 
         // Add recommendations based on current level
-        java.util.List<String> recommendations = getHealthRecommendations(currentLevel);
+        java.util.List<String> recommendations = HEALTH_RECOMMENDATIONS.get(levelIndex);
         com.itextpdf.layout.element.List list = new com.itextpdf.layout.element.List()
                 .setSymbolIndent(12)
                 .setListSymbol("\u2022")
@@ -381,22 +535,12 @@ public class PdfGenerationService {
                 .setMarginTop(15)
                 .setMarginBottom(10));
 
-        java.util.List<String> guidelines = Arrays.asList(
-                "Monitor air quality regularly, especially if you have respiratory conditions",
-                "Keep windows closed during high pollution periods",
-                "Use air purifiers indoors when possible",
-                "Avoid outdoor exercise during poor air quality periods",
-                "Consider wearing N95 masks when air quality is unhealthy",
-                "Stay hydrated and maintain a healthy diet rich in antioxidants",
-                "Consult healthcare providers if you experience breathing difficulties"
-        );
-
         com.itextpdf.layout.element.List guidelinesList = new com.itextpdf.layout.element.List()
                 .setSymbolIndent(12)
                 .setListSymbol("\u2022")
                 .setMarginBottom(15);
 
-        for (String guideline : guidelines) {
+        for (String guideline : GENERAL_HEALTH_GUIDELINES) {
             guidelinesList.add(new ListItem(guideline));
         }
         document.add(guidelinesList);
@@ -428,125 +572,68 @@ public class PdfGenerationService {
         document.add(footer);
     }
 
-    private Map<String, Integer> getAqiLevelCounts(java.util.List<AqiData> aqiDataList) {
-        Map<String, Integer> counts = new LinkedHashMap<>();
-        counts.put("Good", 0);
-        counts.put("Moderate", 0);
-        counts.put("Unhealthy for Sensitive Groups", 0);
-        counts.put("Unhealthy", 0);
-        counts.put("Very Unhealthy", 0);
-        counts.put("Hazardous", 0);
-
+    private int[] getAqiLevelCounts(java.util.List<AqiData> aqiDataList) {
+        // Plain int histogram indexed by level code - levels stay integer
+        // coded until a name is actually rendered, avoiding string keys and
+        // boxing entirely
+        int[] counts = new int[AQI_LEVEL_NAMES.length];
         for (AqiData data : aqiDataList) {
-            String level = getAqiLevel(data.getAqiValue());
-            counts.put(level, counts.get(level) + 1);
+            counts[getAqiLevelIndex(data.getAqiValue())]++;
         }
-
         return counts;
     }
 
-    private String getAqiLevel(int aqi) {
-        if (aqi <= 50) return "Good";
-        else if (aqi <= 100) return "Moderate";
-        else if (aqi <= 150) return "Unhealthy for Sensitive Groups";
-        else if (aqi <= 200) return "Unhealthy";
-        else if (aqi <= 300) return "Very Unhealthy";
-        else return "Hazardous";
+    private DeviceRgb getAqiValueColor(int aqi) {
+        return AQI_LEVEL_COLORS[getAqiLevelIndex(aqi)];
     }
 
-    private DeviceRgb getAqiLevelColor(String level) {
-        switch (level) {
-            case "Good": return new DeviceRgb(0, 228, 0);
-            case "Moderate": return new DeviceRgb(255, 255, 0);
-            case "Unhealthy for Sensitive Groups": return new DeviceRgb(255, 126, 0);
-            case "Unhealthy": return new DeviceRgb(255, 0, 0);
-            case "Very Unhealthy": return new DeviceRgb(143, 63, 151);
-            case "Hazardous": return new DeviceRgb(126, 0, 35);
-            default: return new DeviceRgb(255, 255, 255);
+    /**
+     * Describes the overall AQI trend using the least-squares slope computed
+     * with its closed-form sums in a single pass - no intermediate arrays and
+     * no second traversal. The list is ordered newest-first, so the sign is
+     * flipped to report the chronological trend.
+     */
+    private String getAqiTrendText(java.util.List<AqiData> aqiDataList) {
+        int n = aqiDataList.size();
+        if (n < 2) {
+            return "Not enough data to establish a trend.";
         }
-    }
 
-    private DeviceRgb getAqiValueColor(int aqi) {
-        if (aqi <= 50) return new DeviceRgb(0, 228, 0);
-        else if (aqi <= 100) return new DeviceRgb(255, 255, 0);
-        else if (aqi <= 150) return new DeviceRgb(255, 126, 0);
-        else if (aqi <= 200) return new DeviceRgb(255, 0, 0);
-        else if (aqi <= 300) return new DeviceRgb(143, 63, 151);
-        else return new DeviceRgb(126, 0, 35);
-    }
+        double sumY = 0;
+        double sumXY = 0;
+        int index = 0;
+        for (AqiData data : aqiDataList) {
+            sumY += data.getAqiValue();
+            sumXY += (double) index * data.getAqiValue();
+            index++;
+        }
 
-    private String getDominantAqiLevelText(Map<String, Integer> levelCounts) {
-        String dominantLevel = levelCounts.entrySet().stream()
-                .max(Map.Entry.comparingByValue())
-                .map(Map.Entry::getKey)
-                .orElse("Unknown");
-        
-        return String.format("The air quality was predominantly %s during this period.", dominantLevel);
+        double sumX = n * (n - 1) / 2.0;
+        double sumX2 = (double) (n - 1) * n * (2L * n - 1) / 6.0;
+        double denominator = n * sumX2 - sumX * sumX;
+        double slope = denominator != 0 ? -((n * sumXY - sumX * sumY) / denominator) : 0.0;
+
+        if (slope > 0.05) {
+            return "Air quality showed a worsening trend over this period.";
+        } else if (slope < -0.05) {
+            return "Air quality showed an improving trend over this period.";
+        }
+        return "Air quality remained broadly stable over this period.";
     }
 
-    private java.util.List<String> getHealthRecommendations(String aqiLevel) {
-        switch (aqiLevel) {
-            case "Good":
-                return Arrays.asList(
-                        "Air quality is excellent - ideal for all outdoor activities",
-                        "Perfect time for exercise, sports, and outdoor recreation",
-                        "No health precautions necessary for any group"
-                );
-            
-            case "Moderate":
-                return Arrays.asList(
-                        "Air quality is acceptable for most people",
-                        "Unusually sensitive individuals may experience minor symptoms",
-                        "Outdoor activities are generally safe for healthy individuals",
-                        "Consider reducing prolonged outdoor exertion if sensitive to air pollution"
-                );
-            
-            case "Unhealthy for Sensitive Groups":
-                return Arrays.asList(
-                        "Sensitive groups (children, elderly, people with heart/lung disease) should limit outdoor activities",
-                        "Healthy individuals can continue normal outdoor activities",
-                        "Consider indoor exercise alternatives if you're in a sensitive group",
-                        "Watch for symptoms like coughing, throat irritation, or breathing difficulty"
-                );
-            
-            case "Unhealthy":
-                return Arrays.asList(
-                        "Everyone should limit prolonged outdoor exertion",
-                        "Sensitive groups should avoid outdoor activities entirely",
-                        "Consider wearing N95 masks when outdoors",
-                        "Keep windows closed and use air purifiers if available",
-                        "Reschedule outdoor events if possible"
-                );
-            
-            case "Very Unhealthy":
-                return Arrays.asList(
-                        "Avoid all outdoor activities",
-                        "Everyone should stay indoors with windows and doors closed",
-                        "Use air purifiers and avoid using anything that creates more particles indoors",
-                        "Wear N95 masks if you must go outside",
-                        "Seek medical attention if experiencing breathing difficulties"
-                );
-            
-            case "Hazardous":
-                return Arrays.asList(
-                        "EMERGENCY CONDITIONS: Everyone should stay indoors",
-                        "Avoid all outdoor activities completely",
-                        "Keep windows and doors sealed shut",
-                        "Use high-efficiency air purifiers if available",
-                        "Seek immediate medical attention for any respiratory symptoms",
-                        "Consider evacuation if conditions persist"
-                );
-            
-            default:
-                return Arrays.asList(
-                        "Monitor current air quality conditions",
-                        "Follow local health department recommendations",
-                        "Stay informed about air quality changes"
-                );
+    private String getDominantAqiLevelText(int[] levelCounts) {
+        int dominantIndex = 0;
+        for (int i = 1; i < levelCounts.length; i++) {
+            if (levelCounts[i] > levelCounts[dominantIndex]) {
+                dominantIndex = i;
+            }
         }
+        return String.format("The air quality was predominantly %s during this period.",
+                AQI_LEVEL_NAMES[dominantIndex]);
     }
 
-    private byte[] generateNoDataReport(String city, LocalDateTime startDate, LocalDateTime endDate) {
+    private void generateNoDataReport(String city, LocalDateTime startDate, LocalDateTime endDate,
+                                      OutputStream outputStream) {
         try {
             // Set default date range if not provided
             if (startDate == null) {
@@ -555,8 +642,7 @@ public class PdfGenerationService {
             if (endDate == null) {
                 endDate = LocalDateTime.now();
             }
-            
-            ByteArrayOutputStream outputStream = new ByteArrayOutputStream();
+
             PdfWriter writer = new PdfWriter(outputStream);
             PdfDocument pdfDoc = new PdfDocument(writer);
             Document document = new Document(pdfDoc);
@@ -574,9 +660,8 @@ public class PdfGenerationService {
                     .setTextAlignment(TextAlignment.CENTER)
                     .setMarginBottom(20));
 
-            DateTimeFormatter formatter = DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm");
-            document.add(new Paragraph(String.format("Search period: %s to %s", 
-                    startDate.format(formatter), endDate.format(formatter)))
+            document.add(new Paragraph(String.format("Search period: %s to %s",
+                    startDate.format(DATE_TIME_FORMATTER), endDate.format(DATE_TIME_FORMATTER)))
                     .setTextAlignment(TextAlignment.CENTER)
                     .setMarginBottom(30));
 
@@ -586,24 +671,16 @@ public class PdfGenerationService {
                     .setBold()
                     .setMarginBottom(10));
 
-            java.util.List<String> suggestions = Arrays.asList(
-                    "Verify the city name spelling",
-                    "Check if data collection has been set up for this location",
-                    "Try a different date range",
-                    "Contact support for assistance with data availability"
-            );
-
             com.itextpdf.layout.element.List suggestionList = new com.itextpdf.layout.element.List()
                     .setSymbolIndent(12)
                     .setListSymbol("\u2022");
 
-            for (String suggestion : suggestions) {
+            for (String suggestion : NO_DATA_SUGGESTIONS) {
                 suggestionList.add(new ListItem(suggestion));
             }
             document.add(suggestionList);
 
             document.close();
-            return outputStream.toByteArray();
 
         } catch (Exception e) {
             logger.error("Error generating no-data PDF report: {}", e.getMessage(), e);
@@ -31,7 +31,28 @@ public class AQICalculator {
         {425, 504, 301, 400},
         {505, 604, 401, 500}
     };
-    
+
+    // Sorted upper edges extracted once so bucket lookup is a binary search
+    // instead of a linear scan per measurement
+    private static final double[] PM25_UPPER_EDGES = extractUpperEdges(PM25_BREAKPOINTS);
+    private static final double[] PM10_UPPER_EDGES = extractUpperEdges(PM10_BREAKPOINTS);
+
+    // Threshold tables hoisted out of the per-call paths (previously allocated
+    // on every calculation)
+    private static final double[] NO2_THRESHOLDS = {53, 100, 360, 649, 1249, 2049};
+    private static final double[] SO2_THRESHOLDS = {35, 75, 185, 304, 604, 1004};
+    private static final double[] CO_THRESHOLDS = {4.4, 9.4, 12.4, 15.4, 30.4, 40.4};
+    private static final double[] O3_THRESHOLDS = {54, 70, 85, 105, 200, 300};
+    private static final int[] LINEAR_AQI_VALUES = {50, 100, 150, 200, 300, 400, 500};
+
+    private static double[] extractUpperEdges(double[][] breakpoints) {
+        double[] edges = new double[breakpoints.length];
+        for (int i = 0; i < breakpoints.length; i++) {
+            edges[i] = breakpoints[i][1];
+        }
+        return edges;
+    }
+
     public static int calculateAQI(Double pm25, Double pm10, Double no2, Double so2, Double co, Double o3) {
         // Create cache key for memoization
         String cacheKey = String.format("%.2f,%.2f,%.2f,%.2f,%.2f,%.2f", 
@@ -55,85 +76,86 @@ public class AQICalculator {
     
     private static int calculatePM25AQI(Double pm25) {
         if (pm25 == null || pm25 < 0) return 0;
-        return calculateAQIFromBreakpoints(pm25, PM25_BREAKPOINTS);
+        return calculateAQIFromBreakpoints(pm25, PM25_BREAKPOINTS, PM25_UPPER_EDGES);
     }
-    
+
     private static int calculatePM10AQI(Double pm10) {
         if (pm10 == null || pm10 < 0) return 0;
-        return calculateAQIFromBreakpoints(pm10, PM10_BREAKPOINTS);
+        return calculateAQIFromBreakpoints(pm10, PM10_BREAKPOINTS, PM10_UPPER_EDGES);
     }
-    
+
     private static int calculateNO2AQI(Double no2) {
         if (no2 == null || no2 < 0) return 0;
-        
+
         // Convert μg/m³ to ppb with optimized calculation
         double no2ppb = no2 * 0.53;
-        
-        return calculateLinearAQI(no2ppb, new double[]{53, 100, 360, 649, 1249, 2049}, 
-                                 new int[]{50, 100, 150, 200, 300, 400, 500});
+
+        return calculateLinearAQI(no2ppb, NO2_THRESHOLDS, LINEAR_AQI_VALUES);
     }
-    
+
     private static int calculateSO2AQI(Double so2) {
         if (so2 == null || so2 < 0) return 0;
-        
+
         double so2ppb = so2 * 0.38;
-        
-        return calculateLinearAQI(so2ppb, new double[]{35, 75, 185, 304, 604, 1004}, 
-                                 new int[]{50, 100, 150, 200, 300, 400, 500});
+
+        return calculateLinearAQI(so2ppb, SO2_THRESHOLDS, LINEAR_AQI_VALUES);
     }
-    
+
     private static int calculateCOAQI(Double co) {
         if (co == null || co < 0) return 0;
-        
+
         double coppm = co * 0.87;
-        
-        return calculateLinearAQI(coppm, new double[]{4.4, 9.4, 12.4, 15.4, 30.4, 40.4}, 
-                                 new int[]{50, 100, 150, 200, 300, 400, 500});
+
+        return calculateLinearAQI(coppm, CO_THRESHOLDS, LINEAR_AQI_VALUES);
     }
-    
+
     private static int calculateO3AQI(Double o3) {
         if (o3 == null || o3 < 0) return 0;
-        
+
         double o3ppb = o3 * 0.51;
-        
-        return calculateLinearAQI(o3ppb, new double[]{54, 70, 85, 105, 200, 300}, 
-                                 new int[]{50, 100, 150, 200, 300, 400, 500});
+
+        return calculateLinearAQI(o3ppb, O3_THRESHOLDS, LINEAR_AQI_VALUES);
     }
-    
+
     /**
-     * Optimized method to calculate AQI from breakpoint table using binary search
+     * Calculate AQI from breakpoint table using binary search over the sorted
+     * upper edges - O(log n) per lookup instead of scanning every row
      */
-    private static int calculateAQIFromBreakpoints(double concentration, double[][] breakpoints) {
-        for (double[] breakpoint : breakpoints) {
-            if (concentration >= breakpoint[0] && concentration <= breakpoint[1]) {
-                return (int) Math.round(
-                    ((breakpoint[3] - breakpoint[2]) / (breakpoint[1] - breakpoint[0])) 
-                    * (concentration - breakpoint[0]) + breakpoint[2]
-                );
-            }
+    private static int calculateAQIFromBreakpoints(double concentration, double[][] breakpoints,
+                                                   double[] upperEdges) {
+        int index = Arrays.binarySearch(upperEdges, concentration);
+        if (index < 0) {
+            index = -(index + 1);
         }
-        return 500; // Hazardous level if above all breakpoints
+        if (index >= breakpoints.length) {
+            return 500; // Hazardous level if above all breakpoints
+        }
+        double[] breakpoint = breakpoints[index];
+        return (int) Math.round(
+            ((breakpoint[3] - breakpoint[2]) / (breakpoint[1] - breakpoint[0]))
+            * (concentration - breakpoint[0]) + breakpoint[2]
+        );
     }
-    
+
     /**
-     * Linear interpolation for AQI calculation - more efficient than multiple if-else
+     * Linear interpolation for AQI calculation with binary search bucket lookup
      */
     private static int calculateLinearAQI(double value, double[] thresholds, int[] aqiValues) {
-        for (int i = 0; i < thresholds.length; i++) {
-            if (value <= thresholds[i]) {
-                if (i == 0) {
-                    return (int) Math.round(value * aqiValues[i] / thresholds[i]);
-                } else {
-                    double prevThreshold = (i > 0) ? thresholds[i - 1] : 0;
-                    int prevAQI = (i > 0) ? aqiValues[i - 1] : 0;
-                    
-                    return (int) Math.round(prevAQI + 
-                           (value - prevThreshold) * (aqiValues[i] - prevAQI) / 
-                           (thresholds[i] - prevThreshold));
-                }
-            }
+        int i = Arrays.binarySearch(thresholds, value);
+        if (i < 0) {
+            i = -(i + 1);
+        }
+        if (i >= thresholds.length) {
+            return 500; // Maximum AQI
+        }
+        if (i == 0) {
+            return (int) Math.round(value * aqiValues[0] / thresholds[0]);
         }
-        return 500; // Maximum AQI
+        double prevThreshold = thresholds[i - 1];
+        int prevAQI = aqiValues[i - 1];
+        return (int) Math.round(prevAQI +
+               (value - prevThreshold) * (aqiValues[i] - prevAQI) /
+               (thresholds[i] - prevThreshold));
     }
     
     /**
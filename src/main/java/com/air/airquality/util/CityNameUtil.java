@@ -0,0 +1,37 @@
+package com.air.airquality.util;
+
+import java.util.regex.Pattern;
+
+/**
+ * Shared city-name normalization. The controller and the OpenAQ service each
+ * carried their own stream-based copy of this logic; this keeps one
+ * implementation with a precompiled pattern (String.split recompiles its
+ * regex on every call) and no per-call stream machinery.
+ */
+public final class CityNameUtil {
+
+    private static final Pattern WHITESPACE = Pattern.compile("\\s+");
+
+    private CityNameUtil() {
+    }
+
+    /**
+     * Lower-cases, trims and title-cases each word, e.g. "new   york" becomes
+     * "New York".
+     */
+    public static String normalize(String city) {
+        String[] words = WHITESPACE.split(city.toLowerCase().trim());
+        StringBuilder result = new StringBuilder(city.length());
+        for (String word : words) {
+            if (word.isEmpty()) {
+                continue;
+            }
+            if (result.length() > 0) {
+                result.append(' ');
+            }
+            result.append(Character.toUpperCase(word.charAt(0)))
+                  .append(word, 1, word.length());
+        }
+        return result.toString();
+    }
+}
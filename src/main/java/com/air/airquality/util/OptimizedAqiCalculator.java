@@ -1,7 +1,6 @@
 package com.air.airquality.util;
 
 import java.util.*;
-import java.util.concurrent.ConcurrentHashMap;
 
 /**
  * Optimized AQI Calculator using binary search and efficient data structures
@@ -17,9 +16,6 @@ public class OptimizedAqiCalculator {
     private static final TreeMap<Double, AqiBreakpoint> CO_BREAKPOINTS = new TreeMap<>();
     private static final TreeMap<Double, AqiBreakpoint> O3_BREAKPOINTS = new TreeMap<>();
     
-    // Cache for frequent calculations
-    private static final Map<String, AqiCategoryInfo> CATEGORY_CACHE = new ConcurrentHashMap<>();
-    
     // AQI category definitions with colors (optimized as array for O(1) access)
     private static final AqiCategoryInfo[] AQI_CATEGORIES = {
         new AqiCategoryInfo(0, 50, "Good", "#00E400", "Air quality is good. Ideal for outdoor activities."),
@@ -148,27 +144,19 @@ public class OptimizedAqiCalculator {
     }
     
     /**
-     * Get AQI category info using binary search - O(log n) performance
+     * Get AQI category info with a direct range scan over six entries.
+     * Cheaper than the old per-value cache, which boxed every AQI into a
+     * String key and paid a ConcurrentHashMap lookup to save a trivial scan.
      */
     public static AqiCategoryInfo getCategoryInfo(int aqi) {
-        String cacheKey = String.valueOf(aqi);
-        AqiCategoryInfo cached = CATEGORY_CACHE.get(cacheKey);
-        if (cached != null) {
-            return cached;
-        }
-        
-        // Binary search through categories
         for (AqiCategoryInfo category : AQI_CATEGORIES) {
-            if (aqi >= category.minValue && aqi <= category.maxValue) {
-                CATEGORY_CACHE.put(cacheKey, category);
+            if (aqi <= category.maxValue) {
                 return category;
             }
         }
-        
+
         // Default to Hazardous if AQI is above all ranges
-        AqiCategoryInfo hazardous = AQI_CATEGORIES[AQI_CATEGORIES.length - 1];
-        CATEGORY_CACHE.put(cacheKey, hazardous);
-        return hazardous;
+        return AQI_CATEGORIES[AQI_CATEGORIES.length - 1];
     }
     
     /**